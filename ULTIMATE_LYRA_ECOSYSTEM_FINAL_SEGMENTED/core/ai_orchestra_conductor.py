@@ -15,7 +15,7 @@ import json
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
@@ -70,11 +70,12 @@ class AdmissionDecision:
 class TokenBucket:
     """Rate limiter using token bucket algorithm"""
     
-    def __init__(self, capacity: int, refill_rate: float):
+    def __init__(self, capacity: int, refill_rate: float, time_fn: Callable[[], float] = time.monotonic):
         self.capacity = capacity
         self.tokens = capacity
         self.refill_rate = refill_rate  # tokens per second
-        self.last_refill = time.time()
+        self.time_fn = time_fn  # injectable clock (seconds) for virtual-time tests
+        self.last_refill = time_fn()
         self.lock = threading.Lock()
     
     def consume(self, tokens: int = 1) -> bool:
@@ -86,9 +87,18 @@ class TokenBucket:
                 return True
             return False
     
+    def consume_up_to(self, requested: int, cost: int = 1) -> int:
+        """Consume as many of `requested` units (each costing `cost` tokens) as available.
+        Returns the number of units granted."""
+        with self.lock:
+            self._refill()
+            granted = min(requested, int(self.tokens // cost))
+            self.tokens -= granted * cost
+            return granted
+    
     def _refill(self):
         """Refill tokens based on elapsed time"""
-        now = time.time()
+        now = self.time_fn()
         elapsed = now - self.last_refill
         tokens_to_add = elapsed * self.refill_rate
         self.tokens = min(self.capacity, self.tokens + tokens_to_add)
@@ -103,9 +113,11 @@ class TokenBucket:
 class CircuitBreaker:
     """Circuit breaker for strategy protection"""
     
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60):
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60,
+                 time_fn: Callable[[], float] = time.monotonic):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.time_fn = time_fn  # injectable clock (seconds) for virtual-time tests
         self.failure_count = 0
         self.last_failure_time = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
@@ -113,26 +125,34 @@ class CircuitBreaker:
     
     def call(self, func, *args, **kwargs):
         """Execute function with circuit breaker protection"""
+        ok, result = self.call_safe(func, *args, **kwargs)
+        if not ok:
+            raise result
+        return result
+    
+    def call_safe(self, func, *args, **kwargs) -> Tuple[bool, Any]:
+        """Like call(), but returns (ok, result_or_exception) instead of raising"""
         with self.lock:
             if self.state == "OPEN":
                 if self._should_attempt_reset():
                     self.state = "HALF_OPEN"
                 else:
-                    raise Exception("Circuit breaker is OPEN")
+                    return False, Exception("Circuit breaker is OPEN")
             
             try:
                 result = func(*args, **kwargs)
-                self._on_success()
-                return result
             except Exception as e:
                 self._on_failure()
-                raise e
+                return False, e
+            
+            self._on_success()
+            return True, result
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset"""
         if self.last_failure_time is None:
             return True
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return self.time_fn() - self.last_failure_time >= self.recovery_timeout
     
     def _on_success(self):
         """Handle successful execution"""
@@ -142,7 +162,7 @@ class CircuitBreaker:
     def _on_failure(self):
         """Handle failed execution"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = self.time_fn()
         if self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
 
@@ -239,6 +259,15 @@ class AdmissionController:
         """Main admission control logic"""
         logger.info(f"Processing intent: {intent.strategy} {intent.side.value} {intent.symbol}")
         
+        # 0. Schema check - malformed intents are rejected before any policy lookup
+        shape_check = self._check_intent_shape(intent)
+        if not shape_check[0]:
+            return AdmissionDecision(
+                result=AdmissionResult.REJECT,
+                intent=intent,
+                reason=shape_check[1]
+            )
+        
         # 1. Confidence check
         confidence_check = self._check_confidence(intent)
         if not confidence_check[0]:
@@ -313,6 +342,16 @@ class AdmissionController:
             child_orders=child_orders
         )
     
+    def _check_intent_shape(self, intent: Intent) -> Tuple[bool, str]:
+        """Check that the intent is well-formed"""
+        if not intent.strategy or not intent.symbol:
+            return False, "Invalid intent schema: missing strategy or symbol"
+        if not intent.size_hint > 0:
+            return False, f"Invalid intent schema: size_hint {intent.size_hint} must be positive"
+        if not 0 <= intent.confidence <= 1:
+            return False, f"Invalid intent schema: confidence {intent.confidence} outside [0, 1]"
+        return True, "Intent schema check passed"
+    
     def _check_confidence(self, intent: Intent) -> Tuple[bool, str]:
         """Check if intent meets minimum confidence threshold"""
         min_confidence = self.policy_engine.get_policy("min_confidence", intent.strategy)
@@ -789,6 +828,21 @@ class AIOrchestralConductor:
         self.is_conducting = False
         logger.info("🛑 AI Orchestra Conductor stopped")
     
+    def soft_restart(self):
+        """
+        Restart the conductor in place: reload the model registry and clear
+        runtime state, keeping the policy engine and admission controller
+        """
+        self.is_conducting = False
+        self.ai_models = self._load_ai_models()
+        self.market_data = {}
+        self.performance_metrics = {}
+        self.pending_intents.clear()
+        self.approved_orders.clear()
+        self.execution_history = []
+        
+        logger.info("🔄 AI Orchestral Conductor restarted")
+    
     def get_status(self) -> Dict:
         """Get current conductor status"""
         return {
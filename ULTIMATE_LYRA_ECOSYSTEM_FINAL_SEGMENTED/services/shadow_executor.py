@@ -20,16 +20,61 @@ import json
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union, ClassVar, FrozenSet, Mapping, Tuple
+from dataclasses import dataclass, asdict, fields
 from enum import Enum
+import functools
 import hashlib
 import statistics
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Venue trading rules (read-only, shared across all generators)
+_DEFAULT_VENUE_CONFIG = MappingProxyType({
+    "min_qty": 0.00001,
+    "price_precision": 2,
+    "qty_precision": 6,
+    "tick_size": 0.01
+})
+
+_VENUE_CONFIGS: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    "BINANCE": _DEFAULT_VENUE_CONFIG,
+    "OKX": _DEFAULT_VENUE_CONFIG,
+    "GATE": _DEFAULT_VENUE_CONFIG,
+    "BTCMARKETS": _DEFAULT_VENUE_CONFIG
+})
+
+# Simulated market data for price calculation
+_MARKET_PRICES: Mapping[str, float] = MappingProxyType({
+    "BTC-USDT": 109500.00,
+    "ETH-USDT": 3850.00,
+    "ADA-USDT": 0.85,
+    "SOL-USDT": 220.00,
+    "DOGE-USDT": 0.32
+})
+
+# Diff field classification
+_CRITICAL_FIELDS = frozenset(["venue", "symbol", "side", "order_type"])
+_WARNING_FIELDS = frozenset(["qty", "price", "post_only", "time_in_force"])
+_INFO_FIELDS = frozenset(["client_order_id", "timestamp"])
+_IMPORTANT_FIELDS = _CRITICAL_FIELDS | _WARNING_FIELDS
+
+# Tolerance settings
+_TOLERANCES: Mapping[str, float] = MappingProxyType({
+    "qty": 0.001,  # 0.1% tolerance
+    "price": 0.005,  # 0.5% tolerance
+})
+
 class OrderSide(Enum):
     BUY = "BUY"
     SELL = "SELL"
@@ -45,7 +90,12 @@ class TimeInForce(Enum):
     IOC = "IOC"  # Immediate Or Cancel
     FOK = "FOK"  # Fill Or Kill
 
-@dataclass
+# Interned side strings, normalised once per intent
+_BUY = sys.intern(OrderSide.BUY.value)
+_SELL = sys.intern(OrderSide.SELL.value)
+_SIDES = {_BUY: _BUY, _SELL: _SELL}
+
+@dataclass(slots=True)
 class Intent:
     """Trading intent from AI Orchestra Conductor"""
     id: str
@@ -60,7 +110,7 @@ class Intent:
     venue_hint: Optional[str] = None
     urgency: str = "normal"
 
-@dataclass
+@dataclass(slots=True)
 class ShadowOrder:
     """Shadow order generated from intent"""
     venue: str
@@ -76,7 +126,7 @@ class ShadowOrder:
     intent_id: str
     shadow_id: str
 
-@dataclass
+@dataclass(slots=True)
 class RealOrder:
     """Real order from execution engine"""
     venue: str
@@ -90,7 +140,7 @@ class RealOrder:
     client_order_id: str
     timestamp: str
 
-@dataclass
+@dataclass(slots=True)
 class OrderDiff:
     """Difference between shadow and real order"""
     field: str
@@ -100,7 +150,7 @@ class OrderDiff:
     tolerance_met: bool
     severity: str  # "CRITICAL", "WARNING", "INFO"
 
-@dataclass
+@dataclass(slots=True)
 class ParityResult:
     """Result of shadow vs real order comparison"""
     shadow_order: ShadowOrder
@@ -111,13 +161,13 @@ class ParityResult:
     critical_mismatches: int
     warning_mismatches: int
 
-@dataclass
+@dataclass(slots=True)
 class MirrorRequest:
     """Request to mirror an intent"""
     intent: Intent
     real_orders: List[RealOrder]
 
-@dataclass
+@dataclass(slots=True)
 class MirrorResponse:
     """Response from mirroring operation"""
     shadow_orders: List[ShadowOrder]
@@ -127,45 +177,57 @@ class MirrorResponse:
     recommendations: List[str]
     timestamp: str
 
+@dataclass(frozen=True, slots=True)
+class TemplateOrder:
+    """Intent-independent part of a shadow order, shared via the template cache"""
+    qty: float
+    price: Optional[float]
+    order_type: str
+    post_only: bool
+    time_in_force: str
+    client_tag: str
+    child_tag: str
+    shadow_tag: str
+
+# Fields present on both shadow and real orders, in declaration order
+_SHADOW_FIELD_NAMES = frozenset(f.name for f in fields(ShadowOrder))
+_COMMON_FIELDS = tuple(f.name for f in fields(RealOrder) if f.name in _SHADOW_FIELD_NAMES)
+
+_QTY_TOLERANCE = _TOLERANCES["qty"]
+_PRICE_TOLERANCE = _TOLERANCES["price"]
+
+def _within_tolerance(shadow_value: Any, real_value: Any, tolerance: float) -> bool:
+    """Relative tolerance check; non-numeric values must match exactly"""
+    if shadow_value == real_value:
+        return True
+    if not (isinstance(shadow_value, (int, float)) and isinstance(real_value, (int, float))):
+        return False
+    if shadow_value == 0 or real_value == 0:
+        return abs(shadow_value - real_value) <= tolerance
+    
+    relative_diff = abs(shadow_value - real_value) / max(abs(shadow_value), abs(real_value))
+    return relative_diff <= tolerance
+
+def _tol_qty(shadow_value: Any, real_value: Any) -> bool:
+    return _within_tolerance(shadow_value, real_value, _QTY_TOLERANCE)
+
+def _tol_price(shadow_value: Any, real_value: Any) -> bool:
+    return _within_tolerance(shadow_value, real_value, _PRICE_TOLERANCE)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize dataclasses/dicts to JSON bytes, preferring orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    if hasattr(obj, "__dataclass_fields__"):
+        obj = asdict(obj)
+    return json.dumps(obj).encode()
+
 class ShadowOrderGenerator:
     """Generates shadow orders from trading intents"""
     
-    def __init__(self):
-        self.venue_configs = {
-            "BINANCE": {
-                "min_qty": 0.00001,
-                "price_precision": 2,
-                "qty_precision": 6,
-                "tick_size": 0.01
-            },
-            "OKX": {
-                "min_qty": 0.00001,
-                "price_precision": 2,
-                "qty_precision": 6,
-                "tick_size": 0.01
-            },
-            "GATE": {
-                "min_qty": 0.00001,
-                "price_precision": 2,
-                "qty_precision": 6,
-                "tick_size": 0.01
-            },
-            "BTCMARKETS": {
-                "min_qty": 0.00001,
-                "price_precision": 2,
-                "qty_precision": 6,
-                "tick_size": 0.01
-            }
-        }
-        
-        # Simulated market data for price calculation
-        self.market_prices = {
-            "BTC-USDT": 109500.00,
-            "ETH-USDT": 3850.00,
-            "ADA-USDT": 0.85,
-            "SOL-USDT": 220.00,
-            "DOGE-USDT": 0.32
-        }
+    # Shared read-only tables; one copy for every generator instance
+    venue_configs: ClassVar[Mapping[str, Mapping[str, float]]] = _VENUE_CONFIGS
+    market_prices: ClassVar[Mapping[str, float]] = _MARKET_PRICES
     
     def make_shadow_orders(self, intent: Intent, venue_hint: str) -> List[ShadowOrder]:
         """Generate shadow orders from intent"""
@@ -173,29 +235,66 @@ class ShadowOrderGenerator:
             # Determine venue
             venue = self._determine_venue(intent, venue_hint)
             
-            # Get venue config
-            config = self.venue_configs.get(venue, self.venue_configs["BINANCE"])
+            # Normalise side once for all child orders
+            side = intent.side.upper()
+            side = _SIDES.get(side, side)
+            post_only = intent.constraints.get("post_only", True)
             
-            # Calculate order parameters
-            orders = []
+            # Structural part of the orders is cached per (strategy, symbol, venue, size, side)
+            templates = self._template_orders(intent.strategy, intent.symbol, venue,
+                                              intent.size_hint, side, post_only)
             
-            # Strategy-specific order generation
-            if intent.strategy in ["TWAP", "twap"]:
-                orders = self._generate_twap_orders(intent, venue, config)
-            elif intent.strategy in ["VWAP", "vwap"]:
-                orders = self._generate_vwap_orders(intent, venue, config)
-            elif intent.strategy in ["ICEBERG", "iceberg"]:
-                orders = self._generate_iceberg_orders(intent, venue, config)
-            else:
-                # Default single order
-                orders = self._generate_single_order(intent, venue, config)
+            # Fill in the per-intent fields
+            now = int(time.time())
+            timestamp = datetime.utcnow().isoformat()
+            shadow_id = self._generate_shadow_id(intent)
             
-            return orders
+            return [
+                ShadowOrder(
+                    venue=venue,
+                    symbol=intent.symbol,
+                    side=side,
+                    qty=template.qty,
+                    price=template.price,
+                    order_type=template.order_type,
+                    post_only=template.post_only,
+                    time_in_force=template.time_in_force,
+                    client_order_id=f"{template.client_tag}_{intent.id}{template.child_tag}_{now}",
+                    timestamp=timestamp,
+                    intent_id=intent.id,
+                    shadow_id=f"{shadow_id}{template.shadow_tag}"
+                )
+                for template in templates
+            ]
             
         except Exception as e:
             logger.error(f"Error generating shadow orders: {e}")
             return []
     
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _template_orders(cls, strategy: str, symbol: str, venue: str, size_hint: float,
+                         side: str, post_only: bool) -> Tuple[TemplateOrder, ...]:
+        """Build the intent-independent order templates (cached).
+        
+        The venue and price tables are read-only; if a subclass swaps them,
+        call ``_template_orders.cache_clear()``.
+        """
+        # Get venue config
+        config = cls.venue_configs.get(venue, cls.venue_configs["BINANCE"])
+        market_price = cls.market_prices.get(symbol, 50000.0)
+        
+        # Strategy-specific order generation
+        if strategy in ["TWAP", "twap"]:
+            return cls._generate_twap_orders(size_hint, config, market_price)
+        elif strategy in ["VWAP", "vwap"]:
+            return cls._generate_vwap_orders(size_hint, config, market_price)
+        elif strategy in ["ICEBERG", "iceberg"]:
+            return cls._generate_iceberg_orders(size_hint, config, market_price)
+        else:
+            # Default single order
+            return cls._generate_single_order(size_hint, config, market_price, side, post_only)
+    
     def _determine_venue(self, intent: Intent, venue_hint: str) -> str:
         """Determine the best venue for the intent"""
         if venue_hint:
@@ -209,13 +308,12 @@ class ShadowOrderGenerator:
         else:
             return "BINANCE"  # Default
     
-    def _generate_single_order(self, intent: Intent, venue: str, config: Dict) -> List[ShadowOrder]:
-        """Generate a single shadow order"""
-        # Calculate price
-        market_price = self.market_prices.get(intent.symbol, 50000.0)
-        
+    @staticmethod
+    def _generate_single_order(size_hint: float, config: Mapping[str, float], market_price: float,
+                               side: str, post_only: bool) -> Tuple[TemplateOrder, ...]:
+        """Generate a single shadow order template"""
         # Adjust price based on side and constraints
-        if intent.side.upper() == "BUY":
+        if side == _BUY:
             # For buy orders, place slightly below market for better fill
             price = market_price * 0.999
         else:
@@ -226,41 +324,31 @@ class ShadowOrderGenerator:
         price = round(price, config["price_precision"])
         
         # Calculate quantity
-        qty = intent.size_hint
+        qty = size_hint
         qty = max(qty, config["min_qty"])
         qty = round(qty, config["qty_precision"])
         
-        # Determine order type
-        order_type = "LIMIT"
-        post_only = intent.constraints.get("post_only", True)
-        
-        # Generate shadow order
-        shadow_order = ShadowOrder(
-            venue=venue,
-            symbol=intent.symbol,
-            side=intent.side.upper(),
+        return (TemplateOrder(
             qty=qty,
             price=price,
-            order_type=order_type,
+            order_type="LIMIT",
             post_only=post_only,
             time_in_force="GTC",
-            client_order_id=f"shadow_{intent.id}_{int(time.time())}",
-            timestamp=datetime.utcnow().isoformat(),
-            intent_id=intent.id,
-            shadow_id=self._generate_shadow_id(intent)
-        )
-        
-        return [shadow_order]
+            client_tag="shadow",
+            child_tag="",
+            shadow_tag=""
+        ),)
     
-    def _generate_twap_orders(self, intent: Intent, venue: str, config: Dict) -> List[ShadowOrder]:
-        """Generate TWAP (Time Weighted Average Price) shadow orders"""
+    @staticmethod
+    def _generate_twap_orders(size_hint: float, config: Mapping[str, float],
+                              market_price: float) -> Tuple[TemplateOrder, ...]:
+        """Generate TWAP (Time Weighted Average Price) shadow order templates"""
         # Split into 4 child orders for TWAP
         num_orders = 4
-        child_qty = intent.size_hint / num_orders
+        child_qty = size_hint / num_orders
         child_qty = max(child_qty, config["min_qty"])
         child_qty = round(child_qty, config["qty_precision"])
         
-        market_price = self.market_prices.get(intent.symbol, 50000.0)
         orders = []
         
         for i in range(num_orders):
@@ -269,34 +357,29 @@ class ShadowOrderGenerator:
             price = market_price * price_adjustment
             price = round(price, config["price_precision"])
             
-            shadow_order = ShadowOrder(
-                venue=venue,
-                symbol=intent.symbol,
-                side=intent.side.upper(),
+            orders.append(TemplateOrder(
                 qty=child_qty,
                 price=price,
                 order_type="LIMIT",
                 post_only=True,
                 time_in_force="GTC",
-                client_order_id=f"twap_{intent.id}_{i}_{int(time.time())}",
-                timestamp=datetime.utcnow().isoformat(),
-                intent_id=intent.id,
-                shadow_id=f"{self._generate_shadow_id(intent)}_twap_{i}"
-            )
-            
-            orders.append(shadow_order)
+                client_tag="twap",
+                child_tag=f"_{i}",
+                shadow_tag=f"_twap_{i}"
+            ))
         
-        return orders
+        return tuple(orders)
     
-    def _generate_vwap_orders(self, intent: Intent, venue: str, config: Dict) -> List[ShadowOrder]:
-        """Generate VWAP (Volume Weighted Average Price) shadow orders"""
+    @staticmethod
+    def _generate_vwap_orders(size_hint: float, config: Mapping[str, float],
+                              market_price: float) -> Tuple[TemplateOrder, ...]:
+        """Generate VWAP (Volume Weighted Average Price) shadow order templates"""
         # VWAP with volume-based sizing
         volume_buckets = [0.4, 0.3, 0.2, 0.1]  # Decreasing size
-        market_price = self.market_prices.get(intent.symbol, 50000.0)
         orders = []
         
         for i, volume_weight in enumerate(volume_buckets):
-            child_qty = intent.size_hint * volume_weight
+            child_qty = size_hint * volume_weight
             child_qty = max(child_qty, config["min_qty"])
             child_qty = round(child_qty, config["qty_precision"])
             
@@ -305,51 +388,39 @@ class ShadowOrderGenerator:
             price = market_price * price_adjustment
             price = round(price, config["price_precision"])
             
-            shadow_order = ShadowOrder(
-                venue=venue,
-                symbol=intent.symbol,
-                side=intent.side.upper(),
+            orders.append(TemplateOrder(
                 qty=child_qty,
                 price=price,
                 order_type="LIMIT",
                 post_only=True,
                 time_in_force="GTC",
-                client_order_id=f"vwap_{intent.id}_{i}_{int(time.time())}",
-                timestamp=datetime.utcnow().isoformat(),
-                intent_id=intent.id,
-                shadow_id=f"{self._generate_shadow_id(intent)}_vwap_{i}"
-            )
-            
-            orders.append(shadow_order)
+                client_tag="vwap",
+                child_tag=f"_{i}",
+                shadow_tag=f"_vwap_{i}"
+            ))
         
-        return orders
+        return tuple(orders)
     
-    def _generate_iceberg_orders(self, intent: Intent, venue: str, config: Dict) -> List[ShadowOrder]:
-        """Generate Iceberg shadow orders"""
+    @staticmethod
+    def _generate_iceberg_orders(size_hint: float, config: Mapping[str, float],
+                                 market_price: float) -> Tuple[TemplateOrder, ...]:
+        """Generate Iceberg shadow order templates"""
         # Iceberg with hidden quantity
-        visible_qty = intent.size_hint * 0.2  # Show only 20% of total
+        visible_qty = size_hint * 0.2  # Show only 20% of total
         visible_qty = max(visible_qty, config["min_qty"])
         visible_qty = round(visible_qty, config["qty_precision"])
         
-        market_price = self.market_prices.get(intent.symbol, 50000.0)
-        
         # Single iceberg order
-        shadow_order = ShadowOrder(
-            venue=venue,
-            symbol=intent.symbol,
-            side=intent.side.upper(),
+        return (TemplateOrder(
             qty=visible_qty,
             price=round(market_price * 0.9995, config["price_precision"]),
             order_type="LIMIT",
             post_only=True,
             time_in_force="GTC",
-            client_order_id=f"iceberg_{intent.id}_{int(time.time())}",
-            timestamp=datetime.utcnow().isoformat(),
-            intent_id=intent.id,
-            shadow_id=f"{self._generate_shadow_id(intent)}_iceberg"
-        )
-        
-        return [shadow_order]
+            client_tag="iceberg",
+            child_tag="",
+            shadow_tag="_iceberg"
+        ),)
     
     def _generate_shadow_id(self, intent: Intent) -> str:
         """Generate unique shadow ID"""
@@ -359,16 +430,10 @@ class ShadowOrderGenerator:
 class ShadowDiffEngine:
     """Compares shadow orders with real orders"""
     
-    def __init__(self):
-        self.critical_fields = ["venue", "symbol", "side", "order_type"]
-        self.warning_fields = ["qty", "price", "post_only", "time_in_force"]
-        self.info_fields = ["client_order_id", "timestamp"]
-        
-        # Tolerance settings
-        self.tolerances = {
-            "qty": 0.001,  # 0.1% tolerance
-            "price": 0.005,  # 0.5% tolerance
-        }
+    critical_fields: ClassVar[FrozenSet[str]] = _CRITICAL_FIELDS
+    warning_fields: ClassVar[FrozenSet[str]] = _WARNING_FIELDS
+    info_fields: ClassVar[FrozenSet[str]] = _INFO_FIELDS
+    tolerances: ClassVar[Mapping[str, float]] = _TOLERANCES
     
     def diff_shadow_vs_real(self, shadow_order: ShadowOrder, real_order: RealOrder) -> ParityResult:
         """Compare shadow order with real order"""
@@ -376,20 +441,21 @@ class ShadowDiffEngine:
         critical_mismatches = 0
         warning_mismatches = 0
         
-        # Compare all fields
-        shadow_dict = asdict(shadow_order)
-        real_dict = asdict(real_order)
-        
-        # Only compare common fields
-        common_fields = set(shadow_dict.keys()) & set(real_dict.keys())
-        
-        for field in common_fields:
-            shadow_value = shadow_dict[field]
-            real_value = real_dict[field]
+        # Compare only fields common to both order types
+        for field in _COMMON_FIELDS:
+            shadow_value = getattr(shadow_order, field)
+            real_value = getattr(real_order, field)
             
             # Determine match and tolerance
             match = shadow_value == real_value
-            tolerance_met = self._check_tolerance(field, shadow_value, real_value)
+            if match:
+                tolerance_met = True
+            elif field == "qty":
+                tolerance_met = _tol_qty(shadow_value, real_value)
+            elif field == "price":
+                tolerance_met = _tol_price(shadow_value, real_value)
+            else:
+                tolerance_met = False
             
             # Determine severity
             if field in self.critical_fields:
@@ -417,7 +483,7 @@ class ShadowDiffEngine:
         # Calculate parity
         total_important_fields = len(self.critical_fields) + len(self.warning_fields)
         matching_important = sum(1 for d in diffs 
-                               if d.field in (self.critical_fields + self.warning_fields) 
+                               if d.field in _IMPORTANT_FIELDS 
                                and (d.match or d.tolerance_met))
         
         parity_score = matching_important / total_important_fields if total_important_fields > 0 else 0.0
@@ -433,27 +499,6 @@ class ShadowDiffEngine:
             warning_mismatches=warning_mismatches
         )
     
-    def _check_tolerance(self, field: str, shadow_value: Any, real_value: Any) -> bool:
-        """Check if values are within acceptable tolerance"""
-        if field not in self.tolerances:
-            return shadow_value == real_value
-        
-        tolerance = self.tolerances[field]
-        
-        try:
-            if isinstance(shadow_value, (int, float)) and isinstance(real_value, (int, float)):
-                if shadow_value == 0 and real_value == 0:
-                    return True
-                if shadow_value == 0 or real_value == 0:
-                    return abs(shadow_value - real_value) <= tolerance
-                
-                relative_diff = abs(shadow_value - real_value) / max(abs(shadow_value), abs(real_value))
-                return relative_diff <= tolerance
-        except (TypeError, ZeroDivisionError):
-            pass
-        
-        return shadow_value == real_value
-
 class ShadowExecutor:
     """Main Shadow Executor service"""
     
@@ -612,7 +657,11 @@ class ShadowExecutor:
         if len(self.execution_history) > 10000:
             self.execution_history = self.execution_history[-10000:]
         
-        logger.info(f"Shadow execution: {log_entry}")
+        logger.info(f"Shadow execution: {_dumps(log_entry).decode()}")
+    
+    def serialize_response(self, response: MirrorResponse) -> bytes:
+        """Serialize a mirror response for outbound transport"""
+        return _dumps(response)
     
     def get_health_status(self) -> Dict[str, Any]:
         """Get health status of Shadow Executor"""
@@ -25,14 +25,37 @@ import time
 import logging
 import yaml
 import hashlib
-import statistics
+import itertools
 import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-from enum import Enum
+import sys
+import weakref
+from operator import itemgetter
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Mapping
+from dataclasses import dataclass, asdict, replace
+from enum import Enum, IntEnum
 import aiohttp
-import websockets
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -42,6 +65,15 @@ logger = logging.getLogger(__name__)
 # 1. EXCHANGE URL HARDENING WITH SANITY PROBES
 # ============================================================================
 
+class ExchangeId(IntEnum):
+    """Dense exchange index used for per-exchange array state"""
+    BINANCE = 0
+    OKX = 1
+    GATE = 2
+    BTCMARKETS = 3
+    BYBIT = 4
+    GEMINI = 5
+
 @dataclass
 class ExchangeConfig:
     """Exchange configuration with environment-specific URLs"""
@@ -52,129 +84,289 @@ class ExchangeConfig:
     sandbox_ws: str
     rate_limit_tokens: int
     rate_limit_interval_ms: int
+    ping_path: str = "/api/v3/ping"
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON encoding, preferring orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+# One TCP connector per event loop, shared by every HTTP/WS client in the process
+_SHARED_CONNECTORS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.TCPConnector]" = weakref.WeakKeyDictionary()
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Shared keep-alive pool and DNS cache for the running loop.
+    
+    Sessions using it must pass ``connector_owner=False``.
+    """
+    loop = asyncio.get_running_loop()
+    connector = _SHARED_CONNECTORS.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=128,
+            limit_per_host=8,
+            ttl_dns_cache=600,
+            enable_cleanup_closed=True,
+            keepalive_timeout=75
+        )
+        _SHARED_CONNECTORS[loop] = connector
+    return connector
+
+async def close_shared_connector():
+    """Close the running loop's shared connector at shutdown"""
+    connector = _SHARED_CONNECTORS.pop(asyncio.get_running_loop(), None)
+    if connector is not None and not connector.closed:
+        await connector.close()
+
+# WebSocket probe payload, encoded once at import
+_PING_PAYLOAD = _dumps({"method": "ping"})
+
+# Seconds a host that failed its REST probe is skipped before re-probing
+DEAD_HOST_COOLDOWN_S = 60.0
+
+class VectorThrottle:
+    """Token buckets for many exchanges held as parallel arrays.
+    
+    Refill follows tokens = min(capacity, tokens + elapsed * rate), applied to
+    every requested exchange index in one vectorized step.
+    """
+    
+    def __init__(self, configs: List[ExchangeConfig]):
+        self.capacity = np.array([c.rate_limit_tokens for c in configs], dtype=np.float64)
+        self.refill_per_ns = np.array(
+            [c.rate_limit_tokens / (c.rate_limit_interval_ms * 1_000_000) for c in configs],
+            dtype=np.float64
+        )
+        self.tokens = self.capacity.copy()
+        self.last_ns = np.full(len(configs), time.monotonic_ns(), dtype=np.int64)
+    
+    def try_acquire(self, indices, cost: float = 1.0) -> np.ndarray:
+        """Refill then take `cost` tokens from each index; returns per-index success"""
+        indices = np.asarray(indices, dtype=np.intp)
+        now = time.monotonic_ns()
+        
+        gap = now - self.last_ns[indices]
+        self.tokens[indices] = np.minimum(
+            self.capacity[indices],
+            self.tokens[indices] + gap * self.refill_per_ns[indices]
+        )
+        ok = self.tokens[indices] >= cost
+        self.tokens[indices[ok]] -= cost
+        self.last_ns[indices] = now
+        
+        return ok
+
+# Built once at import; every registry shares the same read-only mapping
+_EXCHANGES: Mapping[str, ExchangeConfig] = MappingProxyType({
+    "BINANCE": ExchangeConfig(
+        name="BINANCE",
+        live_rest="https://api.binance.com",
+        live_ws="wss://stream.binance.com:9443/ws",
+        sandbox_rest="https://testnet.binance.vision",
+        sandbox_ws="wss://testnet.binance.vision/ws",
+        rate_limit_tokens=40,
+        rate_limit_interval_ms=5000,
+        ping_path="/api/v3/ping"
+    ),
+    "OKX": ExchangeConfig(
+        name="OKX",
+        live_rest="https://www.okx.com",
+        live_ws="wss://ws.okx.com:8443/ws/v5/public",
+        sandbox_rest="https://www.okx.com",
+        sandbox_ws="wss://ws.okx.com:8443/ws/v5/public?sandbox=true",
+        rate_limit_tokens=25,
+        rate_limit_interval_ms=5000,
+        ping_path="/api/v5/public/time"
+    ),
+    "GATE": ExchangeConfig(
+        name="GATE",
+        live_rest="https://api.gateio.ws",
+        live_ws="wss://api.gateio.ws/ws/v4/",
+        sandbox_rest="https://api-testnet.gateapi.io",
+        sandbox_ws="wss://api-testnet.gateapi.io/ws/v4/",
+        rate_limit_tokens=15,
+        rate_limit_interval_ms=5000,
+        ping_path="/api/v4/spot/time"
+    ),
+    "BTCMARKETS": ExchangeConfig(
+        name="BTCMARKETS",
+        live_rest="https://api.btcmarkets.net",
+        live_ws="wss://socket.btcmarkets.net",
+        sandbox_rest="https://api.btcmarkets.net",
+        sandbox_ws="wss://socket.btcmarkets.net",
+        rate_limit_tokens=10,
+        rate_limit_interval_ms=5000,
+        ping_path="/v3/markets"
+    ),
+    "BYBIT": ExchangeConfig(
+        name="BYBIT",
+        live_rest="https://api.bybit.com",
+        live_ws="wss://stream.bybit.com/v5/public/spot",
+        sandbox_rest="https://api-testnet.bybit.com",
+        sandbox_ws="wss://stream-testnet.bybit.com/v5/public/spot",
+        rate_limit_tokens=20,
+        rate_limit_interval_ms=5000,
+        ping_path="/v5/market/time"
+    ),
+    "GEMINI": ExchangeConfig(
+        name="GEMINI",
+        live_rest="https://api.gemini.com",
+        live_ws="wss://api.gemini.com/v1/marketdata",
+        sandbox_rest="https://api.sandbox.gemini.com",
+        sandbox_ws="wss://api.sandbox.gemini.com/v1/marketdata",
+        rate_limit_tokens=10,
+        rate_limit_interval_ms=5000,
+        ping_path="/v1/symbols"
+    )
+})
+
+# Configs indexed by ExchangeId, plus a lookup for legacy string callers
+_CONFIGS: Tuple[ExchangeConfig, ...] = tuple(_EXCHANGES[exchange_id.name] for exchange_id in ExchangeId)
+_NAME_TO_ID: Dict[str, ExchangeId] = {exchange_id.name: exchange_id for exchange_id in ExchangeId}
+
+# Sanity probe results are reused within buckets of this many seconds
+PROBE_CACHE_TTL_S = 30
+
+# Per-exchange and overall sanity probe deadlines (seconds)
+PROBE_TIMEOUT_S = 5
+PROBE_ALL_TIMEOUT_S = 6
 
 class ExchangeRegistry:
     """Single source of truth for exchange configurations"""
     
     def __init__(self):
-        self.exchanges = {
-            "BINANCE": ExchangeConfig(
-                name="BINANCE",
-                live_rest="https://api.binance.com",
-                live_ws="wss://stream.binance.com:9443/ws",
-                sandbox_rest="https://testnet.binance.vision",
-                sandbox_ws="wss://testnet.binance.vision/ws",
-                rate_limit_tokens=40,
-                rate_limit_interval_ms=5000
-            ),
-            "OKX": ExchangeConfig(
-                name="OKX",
-                live_rest="https://www.okx.com",
-                live_ws="wss://ws.okx.com:8443/ws/v5/public",
-                sandbox_rest="https://www.okx.com",
-                sandbox_ws="wss://ws.okx.com:8443/ws/v5/public?sandbox=true",
-                rate_limit_tokens=25,
-                rate_limit_interval_ms=5000
-            ),
-            "GATE": ExchangeConfig(
-                name="GATE",
-                live_rest="https://api.gateio.ws",
-                live_ws="wss://api.gateio.ws/ws/v4/",
-                sandbox_rest="https://api-testnet.gateapi.io",
-                sandbox_ws="wss://api-testnet.gateapi.io/ws/v4/",
-                rate_limit_tokens=15,
-                rate_limit_interval_ms=5000
-            ),
-            "BTCMARKETS": ExchangeConfig(
-                name="BTCMARKETS",
-                live_rest="https://api.btcmarkets.net",
-                live_ws="wss://socket.btcmarkets.net",
-                sandbox_rest="https://api.btcmarkets.net",
-                sandbox_ws="wss://socket.btcmarkets.net",
-                rate_limit_tokens=10,
-                rate_limit_interval_ms=5000
-            ),
-            "BYBIT": ExchangeConfig(
-                name="BYBIT",
-                live_rest="https://api.bybit.com",
-                live_ws="wss://stream.bybit.com/v5/public/spot",
-                sandbox_rest="https://api-testnet.bybit.com",
-                sandbox_ws="wss://stream-testnet.bybit.com/v5/public/spot",
-                rate_limit_tokens=20,
-                rate_limit_interval_ms=5000
-            ),
-            "GEMINI": ExchangeConfig(
-                name="GEMINI",
-                live_rest="https://api.gemini.com",
-                live_ws="wss://api.gemini.com/v1/marketdata",
-                sandbox_rest="https://api.sandbox.gemini.com",
-                sandbox_ws="wss://api.sandbox.gemini.com/v1/marketdata",
-                rate_limit_tokens=10,
-                rate_limit_interval_ms=5000
+        self.exchanges = _EXCHANGES
+        # Throttle slots are indexed by ExchangeId
+        self.throttle = VectorThrottle(list(_CONFIGS))
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._dead_hosts: Dict[str, float] = {}
+        self._probe_cache: Dict[Tuple[str, int], Dict[str, bool]] = {}
+    
+    @staticmethod
+    def exchange_id(name: str) -> ExchangeId:
+        """Resolve an exchange name to its ExchangeId (once, off the hot path)"""
+        return _NAME_TO_ID[name.upper()]
+    
+    @staticmethod
+    def config(exchange_id: ExchangeId) -> ExchangeConfig:
+        """Exchange configuration by ExchangeId"""
+        return _CONFIGS[exchange_id]
+    
+    def try_acquire(self, exchange_ids, cost: float = 1.0) -> np.ndarray:
+        """Take rate-limit tokens for one or more ExchangeIds"""
+        return self.throttle.try_acquire(exchange_ids, cost)
+    
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Lazily create the pooled HTTP/WS session shared by all probes"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=5),
+                connector=get_shared_connector(),
+                connector_owner=False
             )
-        }
+        return self._session
+    
+    async def aclose(self):
+        """Close the registry's session (the shared connector stays open)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def sanity_probe_all(self, environment: str = "sandbox") -> Dict[str, bool]:
-        """Perform sanity probes on all exchanges"""
-        results = {}
+        """Perform sanity probes on all exchanges concurrently"""
+        # Reuse results from the current TTL bucket
+        key = (environment, int(time.monotonic() // PROBE_CACHE_TTL_S))
+        if key in self._probe_cache:
+            return dict(self._probe_cache[key])
         
-        for name, config in self.exchanges.items():
+        await self._ensure_session()
+        
+        # Exchanges that never report back count as failed
+        results = {name: False for name in self.exchanges}
+        
+        async def _one(name: str, config: ExchangeConfig):
             try:
-                rest_url = config.sandbox_rest if environment == "sandbox" else config.live_rest
-                ws_url = config.sandbox_ws if environment == "sandbox" else config.live_ws
-                
-                # REST probe
-                rest_ok = await self._probe_rest(rest_url)
-                
-                # WebSocket probe
-                ws_ok = await self._probe_websocket(ws_url)
-                
-                results[name] = rest_ok and ws_ok
-                
-                status = "✅ PASS" if results[name] else "❌ FAIL"
-                logger.info(f"Sanity probe {name}: {status} (REST: {rest_ok}, WS: {ws_ok})")
-                
-            except Exception as e:
-                results[name] = False
-                logger.error(f"Sanity probe {name}: ❌ FAIL - {e}")
+                async with asyncio.timeout(PROBE_TIMEOUT_S):
+                    results[name] = await self._probe_one(name, config, environment)
+            except TimeoutError:
+                logger.error(f"Sanity probe {name}: ❌ FAIL - timed out after {PROBE_TIMEOUT_S}s")
         
-        return results
+        # Bound total wall time regardless of how many probes hang
+        try:
+            async with asyncio.timeout(PROBE_ALL_TIMEOUT_S):
+                async with asyncio.TaskGroup() as tg:
+                    for name, config in self.exchanges.items():
+                        tg.create_task(_one(name, config))
+        except TimeoutError:
+            logger.error(f"Sanity probes exceeded {PROBE_ALL_TIMEOUT_S}s; unfinished exchanges marked failed")
+        
+        # Keep only the current bucket per environment
+        self._probe_cache = {k: v for k, v in self._probe_cache.items() if k[0] != environment}
+        self._probe_cache[key] = results
+        
+        return dict(results)
     
-    async def _probe_rest(self, url: str) -> bool:
-        """Probe REST endpoint"""
+    async def _probe_one(self, name: str, config: ExchangeConfig, environment: str) -> bool:
+        """Probe REST and WebSocket endpoints of a single exchange"""
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Try common endpoints
-                test_endpoints = ["/api/v3/ping", "/api/v1/ping", "/v1/ping", "/ping"]
-                
-                for endpoint in test_endpoints:
-                    try:
-                        async with session.get(f"{url}{endpoint}") as response:
-                            if response.status < 500:  # Accept any non-server error
-                                return True
-                    except:
-                        continue
-                
-                # If no ping endpoint works, try a basic GET
-                async with session.get(url) as response:
-                    return response.status < 500
-                    
+            rest_url = config.sandbox_rest if environment == "sandbox" else config.live_rest
+            ws_url = config.sandbox_ws if environment == "sandbox" else config.live_ws
+            
+            # REST probe
+            rest_ok = await self._probe_rest(rest_url, config.ping_path)
+            
+            # WebSocket probe
+            ws_ok = await self._probe_websocket(ws_url)
+            
+            result = rest_ok and ws_ok
+            
+            status = "✅ PASS" if result else "❌ FAIL"
+            logger.info(f"Sanity probe {name}: {status} (REST: {rest_ok}, WS: {ws_ok})")
+            
+            return result
+            
         except Exception as e:
-            logger.debug(f"REST probe failed for {url}: {e}")
+            logger.error(f"Sanity probe {name}: ❌ FAIL - {e}")
             return False
     
+    async def _probe_rest(self, base_url: str, ping_path: str) -> bool:
+        """Probe REST endpoint via the exchange's known ping path"""
+        # Skip hosts that failed recently
+        retry_at = self._dead_hosts.get(base_url)
+        if retry_at is not None and time.monotonic() < retry_at:
+            return False
+        
+        session = await self._ensure_session()
+        
+        try:
+            async with session.get(f"{base_url}{ping_path}") as response:
+                ok = response.status < 500  # Accept any non-server error
+                
+        except Exception as e:
+            logger.debug(f"REST probe failed for {base_url}: {e}")
+            ok = False
+        
+        if ok:
+            self._dead_hosts.pop(base_url, None)
+        else:
+            self._dead_hosts[base_url] = time.monotonic() + DEAD_HOST_COOLDOWN_S
+        
+        return ok
+    
     async def _probe_websocket(self, url: str) -> bool:
-        """Probe WebSocket endpoint"""
+        """Probe WebSocket endpoint over the shared session"""
+        session = await self._ensure_session()
+        
         try:
             # Quick connection test
-            async with websockets.connect(url, ping_timeout=3, close_timeout=3) as ws:
+            async with session.ws_connect(url, timeout=3, heartbeat=None, receive_timeout=2) as ws:
                 # Send a basic ping or subscribe message
-                await ws.send('{"method": "ping"}')
+                await ws.send_str(_PING_PAYLOAD)
                 
                 # Wait for any response
                 try:
-                    await asyncio.wait_for(ws.recv(), timeout=2)
+                    await ws.receive(timeout=2)
                 except asyncio.TimeoutError:
                     pass  # Timeout is OK, connection worked
                 
@@ -188,6 +380,10 @@ class ExchangeRegistry:
 # 2. SHADOW PARITY + PROMOTION GATES
 # ============================================================================
 
+# Gatekeeper histories are stamped with time.monotonic_ns()
+NS_PER_HOUR = 3600 * 1_000_000_000
+HISTORY_WINDOW_NS = 24 * NS_PER_HOUR
+
 @dataclass
 class PromotionGate:
     """Promotion gate configuration"""
@@ -196,47 +392,58 @@ class PromotionGate:
     error_rate_max: float = 0.01
     dupe_orders_must_equal: int = 0
     slippage_bps_max_p95: float = 25.0
+    history_capacity: int = 65536
+
+class RingBuf:
+    """Fixed-capacity ring buffer of (timestamp_ns, value) samples as parallel arrays"""
+    
+    def __init__(self, capacity: int):
+        self.ts = np.zeros(capacity, dtype=np.int64)
+        self.val = np.zeros(capacity, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, ts_ns: int, value: float):
+        """Insert a sample, overwriting the oldest once full"""
+        self.ts[self.head] = ts_ns
+        self.val[self.head] = value
+        self.head = (self.head + 1) % len(self.ts)
+        if self.count < len(self.ts):
+            self.count += 1
+    
+    def timestamps(self) -> np.ndarray:
+        """View of the filled timestamp slots (unordered once wrapped)"""
+        return self.ts[:self.count]
+    
+    def values(self) -> np.ndarray:
+        """View of the filled value slots, aligned with timestamps()"""
+        return self.val[:self.count]
 
 class PromotionGatekeeper:
     """Manages promotion from shadow to live trading"""
     
     def __init__(self, gate_config: PromotionGate):
         self.config = gate_config
-        self.parity_history = []
-        self.trade_history = []
-        self.error_history = []
+        capacity = gate_config.history_capacity
+        self.parity_history = RingBuf(capacity)
+        self.trade_history = RingBuf(capacity)  # 1.0 = success, 0.0 = error
         self.duplicate_orders = 0
-        self.slippage_history = []
+        self.slippage_history = RingBuf(capacity)
     
     def record_parity(self, parity_rate: float):
         """Record parity rate measurement"""
-        self.parity_history.append({
-            "timestamp": datetime.utcnow(),
-            "parity_rate": parity_rate
-        })
-        
-        # Keep only last 24 hours
-        cutoff = datetime.utcnow() - timedelta(hours=24)
-        self.parity_history = [p for p in self.parity_history if p["timestamp"] > cutoff]
+        self.parity_history.append(time.monotonic_ns(), parity_rate)
     
     def record_trade(self, success: bool, slippage_bps: float = 0.0):
         """Record trade execution"""
-        self.trade_history.append({
-            "timestamp": datetime.utcnow(),
-            "success": success,
-            "slippage_bps": slippage_bps
-        })
-        
-        if not success:
-            self.error_history.append(datetime.utcnow())
+        now_ns = time.monotonic_ns()
+        self.trade_history.append(now_ns, 1.0 if success else 0.0)
         
         if slippage_bps > 0:
-            self.slippage_history.append(slippage_bps)
-        
-        # Keep only last 24 hours
-        cutoff = datetime.utcnow() - timedelta(hours=24)
-        self.trade_history = [t for t in self.trade_history if t["timestamp"] > cutoff]
-        self.error_history = [e for e in self.error_history if e > cutoff]
+            self.slippage_history.append(now_ns, slippage_bps)
     
     def record_duplicate_order(self):
         """Record duplicate order detection"""
@@ -247,39 +454,48 @@ class PromotionGatekeeper:
         reasons = []
         eligible = True
         
+        # Only the last 24 hours of parity/trade history count
+        now_ns = time.monotonic_ns()
+        day_cutoff_ns = now_ns - HISTORY_WINDOW_NS
+        
         # Check parity requirement
-        if len(self.parity_history) == 0:
+        parity_ts = self.parity_history.timestamps()
+        if np.count_nonzero(parity_ts > day_cutoff_ns) == 0:
             eligible = False
             reasons.append("❌ No parity data available")
         else:
             # Check continuous parity for required hours
-            required_duration = timedelta(hours=self.config.require_parity_hours)
-            cutoff = datetime.utcnow() - required_duration
+            cutoff_ns = now_ns - int(self.config.require_parity_hours * NS_PER_HOUR)
             
-            recent_parity = [p for p in self.parity_history if p["timestamp"] > cutoff]
+            recent_parity = self.parity_history.values()[parity_ts > cutoff_ns]
             
-            if len(recent_parity) == 0:
+            if recent_parity.size == 0:
                 eligible = False
                 reasons.append(f"❌ No parity data in last {self.config.require_parity_hours} hours")
             else:
-                perfect_parity = all(p["parity_rate"] >= 1.0 for p in recent_parity)
+                perfect_parity = bool(np.all(recent_parity >= 1.0))
                 if not perfect_parity:
                     eligible = False
-                    avg_parity = statistics.mean([p["parity_rate"] for p in recent_parity])
+                    avg_parity = float(recent_parity.mean())
                     reasons.append(f"❌ Parity not perfect: {avg_parity:.2%} (need 100%)")
                 else:
                     reasons.append(f"✅ Perfect parity maintained for {self.config.require_parity_hours} hours")
         
+        # Trade and error counts over the 24 hour window
+        recent_trades = self.trade_history.timestamps() > day_cutoff_ns
+        trade_count = int(np.count_nonzero(recent_trades))
+        error_count = int(np.count_nonzero(recent_trades & (self.trade_history.values() == 0.0)))
+        
         # Check minimum trades
-        if len(self.trade_history) < self.config.kpi_min_trades:
+        if trade_count < self.config.kpi_min_trades:
             eligible = False
-            reasons.append(f"❌ Insufficient trades: {len(self.trade_history)} < {self.config.kpi_min_trades}")
+            reasons.append(f"❌ Insufficient trades: {trade_count} < {self.config.kpi_min_trades}")
         else:
-            reasons.append(f"✅ Sufficient trades: {len(self.trade_history)}")
+            reasons.append(f"✅ Sufficient trades: {trade_count}")
         
         # Check error rate
-        if len(self.trade_history) > 0:
-            error_rate = len(self.error_history) / len(self.trade_history)
+        if trade_count > 0:
+            error_rate = error_count / trade_count
             if error_rate > self.config.error_rate_max:
                 eligible = False
                 reasons.append(f"❌ Error rate too high: {error_rate:.2%} > {self.config.error_rate_max:.2%}")
@@ -294,8 +510,11 @@ class PromotionGatekeeper:
             reasons.append(f"✅ No duplicate orders: {self.duplicate_orders}")
         
         # Check slippage
-        if len(self.slippage_history) > 0:
-            p95_slippage = statistics.quantiles(self.slippage_history, n=20)[18]  # 95th percentile
+        slippage = self.slippage_history.values()
+        if slippage.size > 0:
+            # 95th percentile by selection (introselect, O(N)); partition works on a copy
+            k = min(int(0.95 * slippage.size), slippage.size - 1)
+            p95_slippage = float(np.partition(slippage, k)[k])
             if p95_slippage > self.config.slippage_bps_max_p95:
                 eligible = False
                 reasons.append(f"❌ Slippage too high: {p95_slippage:.1f} bps > {self.config.slippage_bps_max_p95} bps")
@@ -313,6 +532,7 @@ class CreativeTestSuite:
     
     def __init__(self):
         self.test_results = {}
+        self.rng = np.random.default_rng(42)
     
     async def run_all_tests(self) -> Dict[str, bool]:
         """Run all 10 creative edge-case tests"""
@@ -354,31 +574,21 @@ class CreativeTestSuite:
     async def test_ws_sequence_gap_fuzzer(self) -> bool:
         """Test WebSocket sequence gap handling"""
         # Simulate dropped/duplicate messages
-        sequence_numbers = list(range(1, 101))
+        sequence_numbers = np.arange(1, 101)
         
         # Drop some messages
-        dropped = random.sample(sequence_numbers, 10)
-        received = [n for n in sequence_numbers if n not in dropped]
+        dropped = self.rng.choice(sequence_numbers, 10, replace=False)
+        received = np.setdiff1d(sequence_numbers, dropped)
         
         # Add some duplicates
-        duplicates = random.sample(received, 5)
-        received.extend(duplicates)
-        random.shuffle(received)
-        
-        # Test sequence gap detection
-        gaps_detected = 0
-        duplicates_detected = 0
-        last_seq = 0
-        seen = set()
-        
-        for seq in received:
-            if seq in seen:
-                duplicates_detected += 1
-            else:
-                seen.add(seq)
-                if seq != last_seq + 1 and last_seq > 0:
-                    gaps_detected += 1
-                last_seq = seq
+        duplicates = self.rng.choice(received, 5, replace=False)
+        received = np.concatenate([received, duplicates])
+        self.rng.shuffle(received)
+        
+        # Test sequence gap detection (sequence starts at 1)
+        unique_seqs = np.unique(received)
+        gaps_detected = int(np.count_nonzero(np.diff(unique_seqs, prepend=0) > 1))
+        duplicates_detected = len(received) - len(unique_seqs)
         
         # Should detect gaps and duplicates
         return gaps_detected > 0 and duplicates_detected > 0
@@ -389,11 +599,13 @@ class CreativeTestSuite:
         base_latency = 0.01  # 10ms
         jitter_latency = 0.35  # 350ms
         
+        delays = base_latency + self.rng.uniform(0, jitter_latency, size=10)
+        
         start_time = time.time()
         
         # Simulate processing with high latency
-        for i in range(10):
-            await asyncio.sleep(base_latency + random.uniform(0, jitter_latency))
+        for delay in delays.tolist():
+            await asyncio.sleep(delay)
         
         total_time = time.time() - start_time
         expected_min = 10 * base_latency
@@ -427,21 +639,19 @@ class CreativeTestSuite:
         """Test handling of many partial fills"""
         # Simulate 20 tiny fills over 3 seconds
         order_size = 1.0
-        fills = []
+        num_fills = 20
         
-        for i in range(20):
-            fill_size = order_size / 20  # Tiny fills
-            fills.append({
-                "size": fill_size,
-                "price": 50000 + random.uniform(-10, 10),
-                "timestamp": time.time() + i * 0.15  # 150ms apart
-            })
+        fill_sizes = np.full(num_fills, order_size / num_fills)  # Tiny fills
+        fill_prices = 50000 + self.rng.uniform(-10, 10, size=num_fills)
+        fill_timestamps = time.time() + np.arange(num_fills) * 0.15  # 150ms apart
         
         # Calculate total filled
-        total_filled = sum(f["size"] for f in fills)
+        total_filled = float(fill_sizes.sum())
         
-        # Should match original order size within tolerance
-        return abs(total_filled - order_size) < 0.0001
+        # Should match original order size within tolerance, in time order and near market
+        return (abs(total_filled - order_size) < 0.0001 and
+                bool(np.all(np.diff(fill_timestamps) > 0)) and
+                bool(np.all(np.abs(fill_prices - 50000) <= 10)))
     
     async def test_symbol_churn(self) -> bool:
         """Test symbol delisting/relisting handling"""
@@ -464,27 +674,32 @@ class CreativeTestSuite:
         return trading_stopped and trading_resumed
     
     async def test_rate_limit_burst(self) -> bool:
-        """Test rate limiting and backoff"""
-        # Simulate rate limit burst
-        requests = []
-        rate_limit = 10  # 10 requests per second
+        """Test rate limiting and backoff through the production token bucket"""
+        # 10 requests per second, burst capacity of 10
+        rate_limit = 10
+        bucket = VectorThrottle([replace(_CONFIGS[ExchangeId.BINANCE],
+                                         rate_limit_tokens=rate_limit,
+                                         rate_limit_interval_ms=1000)])
+        slot = [0]
+        
+        total_requests = 20
+        sent = 0
+        throttled = 0
         
         start_time = time.time()
         
-        # Send burst of requests
-        for i in range(20):
-            request_time = time.time()
-            requests.append(request_time)
-            
-            # Simulate rate limiting
-            if len(requests) > rate_limit:
-                # Should backoff
+        # Send burst of requests, backing off whenever the bucket is empty
+        while sent < total_requests:
+            if bucket.try_acquire(slot)[0]:
+                sent += 1
+            else:
+                throttled += 1
                 await asyncio.sleep(0.1)
         
         total_time = time.time() - start_time
         
-        # Should take longer due to rate limiting
-        return total_time > 1.0  # At least 1 second due to backoff
+        # The burst beyond capacity must wait for refill: 10 extra tokens at 10/s
+        return throttled > 0 and total_time >= 0.9 * (total_requests - rate_limit) / rate_limit
     
     async def test_clock_skew(self) -> bool:
         """Test clock skew handling"""
@@ -500,23 +715,19 @@ class CreativeTestSuite:
         return skew <= max_skew
     
     async def test_pathological_spreads(self) -> bool:
-        """Test handling of extreme spreads"""
-        # Test spread scenarios
-        normal_spread = {"bid": 50000, "ask": 50010}  # 10 USD spread
-        wide_spread = {"bid": 50000, "ask": 51000}    # 1000 USD spread
-        collapsed_spread = {"bid": 50000, "ask": 50000.01}  # 1 cent spread
+        """Test handling of extreme spreads.
         
-        # Should handle all spread scenarios
-        spreads_handled = 0
+        Spreads are evaluated as one vectorized pass over bid/ask arrays, the
+        same layout a production spread monitor would use per tick.
+        """
+        # Test spread scenarios: normal (10 USD), wide (1000 USD), collapsed (1 cent)
+        bids = np.array([50000.0, 50000.0, 50000.0])
+        asks = np.array([50010.0, 51000.0, 50000.01])
         
-        for spread in [normal_spread, wide_spread, collapsed_spread]:
-            spread_bps = ((spread["ask"] - spread["bid"]) / spread["bid"]) * 10000
-            
-            # Should detect and handle appropriately
-            if spread_bps > 0:
-                spreads_handled += 1
+        spread_bps = (asks - bids) / bids * 10000
         
-        return spreads_handled == 3
+        # Should detect and handle all spread scenarios
+        return bool(np.all(spread_bps > 0))
     
     async def test_triangular_arb_drift(self) -> bool:
         """Test triangular arbitrage with stale data"""
@@ -582,84 +793,139 @@ class UniverseConfig:
 class DynamicUniverseBuilder:
     """Builds and maintains dynamic symbol universe"""
     
-    def __init__(self, config: UniverseConfig):
+    # Stats mirrored into per-symbol arrays: stat key -> (array attribute, default)
+    _ARRAY_STATS = {
+        "24h_notional_usd": ("_notional", 0.0),
+        "top_of_book_usd": ("_top_book", 0.0),
+        "book_imbalance": ("_book_imbalance", 0.5),
+        "velocity_stddev": ("_velocity_stddev", 1.0),
+        "zero_fills_minutes": ("_zero_fills_minutes", 0.0),
+        "spread_bps": ("_spread_bps", 10.0),
+    }
+    
+    def __init__(self, config: UniverseConfig, initial_capacity: int = 256):
         self.config = config
         self.symbol_stats = {}
         self.current_tiers = {"T1": [], "T2": [], "T3": []}
         self.hotlist = set()
-    
-    def update_symbol_stats(self, symbol: str, stats: Dict[str, Any]):
-        """Update statistics for a symbol"""
+        self._hot_mask = np.zeros(0, dtype=bool)
+        
+        # Symbol <-> array index mapping for the SoA stats
+        self._symbol_index: Dict[str, int] = {}
+        self._symbol_for_idx: List[str] = []
+        for attr, default in self._ARRAY_STATS.values():
+            setattr(self, attr, np.full(initial_capacity, default, dtype=np.float64))
+    
+    def _index_for(self, symbol: str) -> int:
+        """Return the array index of a symbol, allocating one if new"""
+        idx = self._symbol_index.get(symbol)
+        if idx is None:
+            idx = len(self._symbol_for_idx)
+            if idx == len(self._notional):
+                self._grow()
+            self._symbol_index[symbol] = idx
+            self._symbol_for_idx.append(symbol)
+        return idx
+    
+    def _grow(self):
+        """Double the capacity of the per-symbol arrays"""
+        for attr, default in self._ARRAY_STATS.values():
+            current = getattr(self, attr)
+            extra = np.full(max(len(current), 1), default, dtype=np.float64)
+            setattr(self, attr, np.concatenate([current, extra]))
+    
+    def update_symbol_stats(self, symbol: str, stats: Dict[str, Any], now_ns: Optional[int] = None):
+        """Update statistics for a symbol.
+        
+        Batch callers should pass the tick's ``now_ns`` so every symbol in the
+        tick shares one timestamp.
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        
         self.symbol_stats[symbol] = {
             **stats,
-            "last_update": datetime.utcnow()
+            "last_update_ns": now_ns
         }
+        
+        idx = self._index_for(symbol)
+        for key, (attr, default) in self._ARRAY_STATS.items():
+            getattr(self, attr)[idx] = stats.get(key, default)
     
     def build_universe(self) -> Dict[str, List[str]]:
         """Build tiered symbol universe"""
-        # Filter symbols by minimum criteria
-        eligible_symbols = []
-        
-        for symbol, stats in self.symbol_stats.items():
-            if (stats.get("24h_notional_usd", 0) >= self.config.min_24h_notional_usd and
-                stats.get("top_of_book_usd", 0) >= self.config.min_top_of_book_usd):
-                eligible_symbols.append((symbol, stats))
-        
-        # Sort by volume/activity
-        eligible_symbols.sort(key=lambda x: x[1].get("24h_notional_usd", 0), reverse=True)
-        
-        # Assign to tiers
-        new_tiers = {"T1": [], "T2": [], "T3": []}
-        
-        # T1 - Top symbols
         t1_size = self.config.tiers["T1"].size
-        new_tiers["T1"] = [s[0] for s in eligible_symbols[:t1_size]]
-        
-        # T2 - Mid-tier symbols
         t2_size = self.config.tiers["T2"].size
-        new_tiers["T2"] = [s[0] for s in eligible_symbols[t1_size:t1_size + t2_size]]
-        
-        # T3 - Long-tail symbols
         t3_size = self.config.tiers["T3"].size
-        new_tiers["T3"] = [s[0] for s in eligible_symbols[t1_size + t2_size:t1_size + t2_size + t3_size]]
+        
+        # Filter symbols by minimum criteria
+        count = len(self._symbol_for_idx)
+        eligible = np.flatnonzero(
+            (self._notional[:count] >= self.config.min_24h_notional_usd) &
+            (self._top_book[:count] >= self.config.min_top_of_book_usd)
+        )
+        
+        # Rank only as many symbols as the tiers can hold, by volume/activity
+        ranked = self._top_by_notional(eligible, t1_size + t2_size + t3_size)
+        
+        # Assign to tiers as bitmasks over the symbol index space
+        t1_mask = np.zeros(count, dtype=bool)
+        t2_mask = np.zeros(count, dtype=bool)
+        t3_mask = np.zeros(count, dtype=bool)
+        t1_mask[ranked[:t1_size]] = True                                   # Top symbols
+        t2_mask[ranked[t1_size:t1_size + t2_size]] = True                  # Mid-tier symbols
+        t3_mask[ranked[t1_size + t2_size:t1_size + t2_size + t3_size]] = True  # Long-tail symbols
         
         # Update hotlist
         self._update_hotlist()
-        
-        # Promote hotlist symbols to higher tiers
-        for symbol in self.hotlist:
-            if symbol in new_tiers["T3"]:
-                new_tiers["T3"].remove(symbol)
-                new_tiers["T2"].append(symbol)
-            elif symbol in new_tiers["T2"]:
-                new_tiers["T2"].remove(symbol)
-                new_tiers["T1"].append(symbol)
+        hot_mask = self._hot_mask
+        
+        # Promote hotlist symbols one tier up
+        promote_from_t3 = t3_mask & hot_mask
+        promote_from_t2 = t2_mask & hot_mask
+        t3_mask &= ~promote_from_t3
+        t2_mask = (t2_mask & ~promote_from_t2) | promote_from_t3
+        t1_mask |= promote_from_t2
+        
+        # Materialize symbol lists in rank order
+        new_tiers = {
+            tier: [self._symbol_for_idx[i] for i in ranked[mask[ranked]]]
+            for tier, mask in (("T1", t1_mask), ("T2", t2_mask), ("T3", t3_mask))
+        }
         
         self.current_tiers = new_tiers
         return new_tiers
     
+    def _top_by_notional(self, idx: np.ndarray, k: int) -> np.ndarray:
+        """Top-k indices by 24h notional, descending, ties in insertion order"""
+        if k <= 0 or idx.size == 0:
+            return idx[:0]
+        
+        values = self._notional[idx]
+        if k < idx.size:
+            # Linear-time selection, keeping every value tied with the k-th largest
+            kth_value = values[np.argpartition(-values, k - 1)[k - 1]]
+            keep = values >= kth_value
+            idx, values = idx[keep], values[keep]
+        
+        order = np.lexsort((idx, -values))
+        return idx[order][:k]
+    
     def _update_hotlist(self):
         """Update hotlist based on activity"""
-        new_hotlist = set()
+        count = len(self._symbol_for_idx)
+        config = self.config
         
-        for symbol, stats in self.symbol_stats.items():
-            # Promote conditions
-            book_imbalance = stats.get("book_imbalance", 0.5)
-            velocity_stddev = stats.get("velocity_stddev", 1.0)
-            
-            if (book_imbalance >= self.config.hotlist_promote_book_imbalance_min or
-                velocity_stddev >= self.config.hotlist_promote_velocity_stddev_min):
-                new_hotlist.add(symbol)
-            
-            # Demote conditions
-            zero_fills_minutes = stats.get("zero_fills_minutes", 0)
-            spread_bps = stats.get("spread_bps", 10)
-            
-            if (zero_fills_minutes >= self.config.hotlist_demote_zero_fills_minutes or
-                spread_bps >= self.config.hotlist_demote_spread_bps_over):
-                new_hotlist.discard(symbol)
+        # Promote conditions
+        promote = ((self._book_imbalance[:count] >= config.hotlist_promote_book_imbalance_min) |
+                   (self._velocity_stddev[:count] >= config.hotlist_promote_velocity_stddev_min))
+        
+        # Demote conditions
+        demote = ((self._zero_fills_minutes[:count] >= config.hotlist_demote_zero_fills_minutes) |
+                  (self._spread_bps[:count] >= config.hotlist_demote_spread_bps_over))
         
-        self.hotlist = new_hotlist
+        self._hot_mask = promote & ~demote
+        self.hotlist = {self._symbol_for_idx[i] for i in np.flatnonzero(self._hot_mask)}
 
 # ============================================================================
 # 5. SAFER MAX-INTENSITY EXECUTION
@@ -675,197 +941,453 @@ class ExecutionPolicy:
     max_in_flight_per_strategy: int = 4
     max_position_pct: float = 2.0
     max_venue_exposure_pct: float = 25.0
+    simulate_latency: bool = False  # Sleep to mimic venue round trips (demo/testing only)
+    max_order_lifetime_s: float = 30.0  # In-flight orders older than this are released
+
+@dataclass(slots=True)
+class InFlight:
+    """Tracked in-flight order"""
+    intent: Dict[str, Any]
+    idempotency_key: str
+    timestamp: float  # time.time() at submission
+    strategy: str
+    venue: str
+    monotonic_ts: float  # time.monotonic() at submission, used for expiry
+
+# Recent idempotency keys kept for duplicate detection (oldest evicted first)
+IDEMPOTENCY_LRU_MAX = 10_000
+
+# When intents are already coalescing, later ones arriving within this window
+# join the same batch per venue
+FLUSH_MS = 3
+
+# How often expired in-flight orders are swept
+SWEEP_INTERVAL_S = 1.0
+
+_INTENT_KEY_FIELDS = ("symbol", "side", "size", "timestamp")
+
+# Rejection result templates, read-only; each caller gets its own copy
+_REJ_GLOBAL = "Global in-flight limit exceeded"
+_REJ_STRATEGY = "Strategy in-flight limit exceeded"
+_REJ_VENUE = "Venue exposure limit exceeded"
+_REJ_DUPLICATE = "Duplicate order detected"
+_REJ: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    reason: MappingProxyType({"status": "rejected", "reason": reason})
+    for reason in (_REJ_GLOBAL, _REJ_STRATEGY, _REJ_VENUE, _REJ_DUPLICATE)
+})
+_intent_key_values = itemgetter(*_INTENT_KEY_FIELDS)
+
+def _intern(value: Any) -> Any:
+    """Intern str values; anything else (e.g. a malformed None) passes through"""
+    return sys.intern(value) if type(value) is str else value
 
 class SafeExecutionEngine:
     """Safer execution engine with strict controls"""
     
     def __init__(self, policy: ExecutionPolicy):
         self.policy = policy
-        self.in_flight_orders = {}
-        self.strategy_orders = {}
+        self.in_flight_orders: Dict[str, InFlight] = {}
+        self.strategy_counts: Dict[str, int] = {}
         self.venue_exposure = {}
-        self.idempotency_keys = set()
+        self.idempotency_keys: "OrderedDict[str, None]" = OrderedDict()
+        self._pending: Dict[str, List[Tuple[Dict[str, Any], str, asyncio.Future]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._order_seq = itertools.count(1)
+        self._sweeper: Optional[asyncio.Task] = None
     
     async def execute_intent(self, intent: Dict[str, Any]) -> Dict[str, Any]:
         """Execute trading intent with safety checks"""
-        # Check global limits
-        if len(self.in_flight_orders) >= self.policy.max_in_flight_global:
-            return {"status": "rejected", "reason": "Global in-flight limit exceeded"}
+        # Interned so the per-strategy/venue dict lookups compare by identity
+        strategy = _intern(intent.get("strategy", "default"))
+        venue = _intern(intent.get("venue", "BINANCE"))
         
-        # Check strategy limits
-        strategy = intent.get("strategy", "default")
-        strategy_count = len(self.strategy_orders.get(strategy, []))
-        if strategy_count >= self.policy.max_in_flight_per_strategy:
-            return {"status": "rejected", "reason": "Strategy in-flight limit exceeded"}
-        
-        # Check venue exposure
-        venue = intent.get("venue", "BINANCE")
-        venue_exposure = self.venue_exposure.get(venue, 0)
-        if venue_exposure >= self.policy.max_venue_exposure_pct:
-            return {"status": "rejected", "reason": "Venue exposure limit exceeded"}
+        reason = self._gate(strategy, venue)
+        if reason:
+            return dict(_REJ[reason])
         
         # Generate idempotency key
         idempotency_key = self._generate_idempotency_key(intent)
         if idempotency_key in self.idempotency_keys:
-            return {"status": "rejected", "reason": "Duplicate order detected"}
+            self.idempotency_keys.move_to_end(idempotency_key)
+            return dict(_REJ[_REJ_DUPLICATE])
+        
+        # Reserve the key before awaiting, so concurrent copies of this intent
+        # (e.g. coalesced into the same batch) are rejected as duplicates
+        self._reserve_key(idempotency_key)
         
         # Execute with POST_ONLY first
-        order_result = await self._execute_with_fallback(intent, idempotency_key)
+        try:
+            order_result = await self._execute_with_fallback(intent, idempotency_key)
+        except BaseException:
+            self.idempotency_keys.pop(idempotency_key, None)
+            raise
         
         # Track order
         if order_result["status"] == "submitted":
-            self._track_order(intent, idempotency_key)
+            order_result["in_flight_id"] = self._track_order(intent, idempotency_key, strategy, venue)
+            if self._sweeper is None:
+                self._sweeper = asyncio.create_task(self._sweep_loop())
+        else:
+            # Not submitted: release the key so the intent can be retried
+            self.idempotency_keys.pop(idempotency_key, None)
         
         return order_result
     
+    def _reserve_key(self, idempotency_key: str):
+        """Record an idempotency key in the bounded LRU window"""
+        keys = self.idempotency_keys
+        keys[idempotency_key] = None
+        keys.move_to_end(idempotency_key)
+        if len(keys) > IDEMPOTENCY_LRU_MAX:
+            keys.popitem(last=False)
+    
+    def _gate(self, strategy: str, venue: str) -> Optional[str]:
+        """Global, strategy and venue limit checks; returns the rejection reason if any"""
+        policy = self.policy
+        if len(self.in_flight_orders) >= policy.max_in_flight_global:
+            return _REJ_GLOBAL
+        if self.strategy_counts.get(strategy, 0) >= policy.max_in_flight_per_strategy:
+            return _REJ_STRATEGY
+        if self.venue_exposure.get(venue, 0) >= policy.max_venue_exposure_pct:
+            return _REJ_VENUE
+        return None
+    
     async def _execute_with_fallback(self, intent: Dict[str, Any], idempotency_key: str) -> Dict[str, Any]:
         """Execute with POST_ONLY -> IOC fallback"""
-        # Try POST_ONLY first
-        post_only_result = await self._submit_post_only_order(intent, idempotency_key)
+        # Build the IOC order while POST_ONLY is in flight so fallback is just a send
+        ioc_prep = None
+        if intent.get("allow_ioc_fallback", True):
+            ioc_prep = asyncio.create_task(self._prepare_ioc_payload(intent, idempotency_key))
         
-        if post_only_result["status"] == "submitted":
+        # Try POST_ONLY first
+        try:
+            post_only_result = await self._submit_post_only_order(intent, idempotency_key)
+        except BaseException:
+            if ioc_prep is not None:
+                ioc_prep.cancel()
+            raise
+        
+        if post_only_result["status"] == "submitted" or ioc_prep is None:
+            if ioc_prep is not None:
+                ioc_prep.cancel()
             return post_only_result
         
         # Fallback to IOC if POST_ONLY fails
-        if intent.get("allow_ioc_fallback", True):
-            return await self._submit_ioc_order(intent, idempotency_key)
-        
-        return post_only_result
+        return await self._send_ioc(await ioc_prep)
     
     async def _submit_post_only_order(self, intent: Dict[str, Any], idempotency_key: str) -> Dict[str, Any]:
-        """Submit POST_ONLY order"""
+        """Queue POST_ONLY order for its venue's next batch and wait for the result"""
+        venue = intent.get("venue", "BINANCE")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(venue, []).append((intent, idempotency_key, future))
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        return await future
+    
+    async def _flush_pending(self):
+        """Submit queued POST_ONLY orders, one batch per venue.
+        
+        Intents issued in the same loop iteration always share a batch; the
+        FLUSH_MS window is only held open when that already coalesced more
+        than one order, so a lone order goes out without waiting.
+        """
+        pending = None
+        try:
+            await asyncio.sleep(0)
+            if sum(map(len, self._pending.values())) > 1:
+                await asyncio.sleep(FLUSH_MS / 1000)
+            pending, self._pending = self._pending, {}
+        finally:
+            self._flush_task = None
+            if pending is None:
+                # Cancelled before dispatch: don't leave queued intents waiting forever
+                pending, self._pending = self._pending, {}
+                for batch in pending.values():
+                    for _, _, future in batch:
+                        future.cancel()
+        await asyncio.gather(*(self._dispatch_batch(venue, batch) for venue, batch in pending.items()))
+    
+    async def _dispatch_batch(self, venue: str, batch: List[Tuple[Dict[str, Any], str, asyncio.Future]]):
+        """Submit one venue batch and resolve each waiting intent"""
+        try:
+            results = await self._submit_post_only_batch(venue, [(intent, key) for intent, key, _ in batch])
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    async def _submit_post_only_batch(self, venue: str, orders: List[Tuple[Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+        """Submit POST_ONLY orders for one venue in a single mass-quote request"""
         # Simulate order submission
-        await asyncio.sleep(0.01)  # Simulate network latency
+        if self.policy.simulate_latency:
+            await asyncio.sleep(0.01)  # Simulate network latency, paid once per batch
         
-        return {
+        return [{
             "status": "submitted",
             "order_id": f"post_{idempotency_key[:8]}",
             "type": "POST_ONLY_LIMIT",
             "idempotency_key": idempotency_key
-        }
+        } for _, idempotency_key in orders]
     
-    async def _submit_ioc_order(self, intent: Dict[str, Any], idempotency_key: str) -> Dict[str, Any]:
-        """Submit IOC order with slippage protection"""
+    async def _prepare_ioc_payload(self, intent: Dict[str, Any], idempotency_key: str) -> Dict[str, Any]:
+        """Build IOC order with slippage protection"""
         # Check slippage limits
         max_slippage = self.policy.ioc_fallback_slippage_bps
         
-        # Simulate order submission
-        await asyncio.sleep(0.005)  # Faster for IOC
-        
         return {
-            "status": "submitted",
             "order_id": f"ioc_{idempotency_key[:8]}",
             "type": "IOC",
             "max_slippage_bps": max_slippage,
             "idempotency_key": idempotency_key
         }
     
+    async def _send_ioc(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Submit a prepared IOC order"""
+        # Simulate order submission
+        if self.policy.simulate_latency:
+            await asyncio.sleep(0.005)  # Faster for IOC
+        
+        return {"status": "submitted", **payload}
+    
     def _generate_idempotency_key(self, intent: Dict[str, Any]) -> str:
-        """Generate unique idempotency key"""
-        key_data = f"{intent.get('symbol')}_{intent.get('side')}_{intent.get('size')}_{intent.get('timestamp')}"
+        """Generate unique idempotency key (32 hex chars)"""
+        try:
+            symbol, side, size, timestamp = _intent_key_values(intent)
+        except KeyError:
+            symbol, side, size, timestamp = map(intent.get, _INTENT_KEY_FIELDS)
+        key_data = f"{symbol}_{side}_{size}_{timestamp}"
+        # Dedupe key only, not a security token: a fast non-cryptographic hash is enough
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(key_data.encode())
         return hashlib.md5(key_data.encode()).hexdigest()
     
-    def _track_order(self, intent: Dict[str, Any], idempotency_key: str):
-        """Track in-flight order"""
-        order_id = f"order_{len(self.in_flight_orders)}"
+    def _track_order(self, intent: Dict[str, Any], idempotency_key: str, strategy: str, venue: str) -> str:
+        """Track in-flight order and return its in-flight id"""
+        # Monotonic, so ids are never reused after release_order
+        order_id = f"order_{next(self._order_seq)}"
         
-        self.in_flight_orders[order_id] = {
-            "intent": intent,
-            "idempotency_key": idempotency_key,
-            "timestamp": datetime.utcnow()
-        }
+        self.in_flight_orders[order_id] = InFlight(
+            intent, idempotency_key, time.time(), strategy, venue, time.monotonic()
+        )
         
         # Track by strategy
-        strategy = intent.get("strategy", "default")
-        if strategy not in self.strategy_orders:
-            self.strategy_orders[strategy] = []
-        self.strategy_orders[strategy].append(order_id)
+        self.strategy_counts[strategy] = self.strategy_counts.get(strategy, 0) + 1
         
         # Track venue exposure
-        venue = intent.get("venue", "BINANCE")
         self.venue_exposure[venue] = self.venue_exposure.get(venue, 0) + 1
         
-        # Track idempotency
-        self.idempotency_keys.add(idempotency_key)
+        return order_id
+    
+    def release_order(self, order_id: str) -> bool:
+        """Release a completed in-flight order; False if it is not tracked"""
+        order = self.in_flight_orders.pop(order_id, None)
+        if order is None:
+            return False
+        
+        self.strategy_counts[order.strategy] -= 1
+        self.venue_exposure[order.venue] -= 1
+        return True
+    
+    def sweep_expired(self, now: Optional[float] = None) -> int:
+        """Release orders older than max_order_lifetime_s; returns how many"""
+        cutoff = (time.monotonic() if now is None else now) - self.policy.max_order_lifetime_s
+        expired = []
+        # Dict order is submission order, so stop at the first live order
+        for order_id, order in self.in_flight_orders.items():
+            if order.monotonic_ts > cutoff:
+                break
+            expired.append(order_id)
+        
+        for order_id in expired:
+            self.release_order(order_id)
+        if expired:
+            logger.warning(f"Released {len(expired)} in-flight orders past {self.policy.max_order_lifetime_s}s")
+        return len(expired)
+    
+    async def _sweep_loop(self):
+        """Sweep expired orders every SWEEP_INTERVAL_S while any are in flight"""
+        try:
+            while self.in_flight_orders:
+                await asyncio.sleep(SWEEP_INTERVAL_S)
+                self.sweep_expired()
+        finally:
+            self._sweeper = None
 
 # ============================================================================
 # 6. BOARD-READY EVIDENCE PACKAGE
 # ============================================================================
 
+# Last formatted UTC timestamp; reformatted at most once per millisecond
+_TS_CACHE = {"ns": 0, "iso": ""}
+
+def _now_iso() -> str:
+    """UTC ISO-8601 timestamp at millisecond granularity"""
+    ns = time.time_ns()
+    if ns - _TS_CACHE["ns"] > 1_000_000:
+        _TS_CACHE["ns"] = ns
+        _TS_CACHE["iso"] = datetime.utcfromtimestamp(ns / 1e9).isoformat()
+    return _TS_CACHE["iso"]
+
+# Digest algorithm behind _new_hasher, recorded in evidence manifests
+_EVIDENCE_HASH_ALGORITHM = "xxh3_128" if XXHASH_AVAILABLE else "md5"
+
+def _new_hasher():
+    """Incremental 128-bit hasher (xxh3 when available, else MD5)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    return hashlib.md5()
+
+def _canonical_default(value: Any) -> str:
+    """Encode non-JSON values for hashing; naive datetimes are taken as UTC"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+def _canonical_bytes(obj: Any) -> bytes:
+    """Key-sorted compact JSON encoding used for evidence hashing.
+    
+    Always stdlib json, so digests of the same evidence do not depend on
+    whether orjson is installed.
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+                      default=_canonical_default).encode()
+
+def _dumps_indented(obj: Any) -> str:
+    """Human-readable JSON (2-space indent), preferring orjson"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+# Column padding for fields an evidence entry did not have (distinct from None)
+_ABSENT = object()
+
+class EvidenceStream:
+    """Append-only evidence log stored column-wise, one list per field.
+    
+    Fields missing from an entry are padded with _ABSENT, so rows() returns
+    each entry with exactly the fields it was recorded with. When hashed, a
+    running digest is updated on every append so integrity hashes cost O(1)
+    to read.
+    """
+    
+    __slots__ = ("columns", "_rows", "_hasher")
+    
+    def __init__(self, hashed: bool = False):
+        self.columns: Dict[str, List[Any]] = {}
+        self._rows = 0
+        self._hasher = _new_hasher() if hashed else None
+    
+    def __len__(self) -> int:
+        return self._rows
+    
+    def append(self, entry: Mapping[str, Any], **extra: Any):
+        """Append one entry plus any extra fields (e.g. recorded_at)"""
+        columns = self.columns
+        rows = self._rows
+        if extra:
+            # Extra fields take precedence, as in {**entry, **extra}
+            entry = {field: value for field, value in entry.items() if field not in extra}
+        for fields in (entry, extra):
+            for field, value in fields.items():
+                column = columns.get(field)
+                if column is None:
+                    column = columns[field] = [_ABSENT] * rows
+                column.append(value)
+        self._rows = rows + 1
+        if len(columns) > len(entry) + len(extra):
+            for column in columns.values():
+                if len(column) == rows:
+                    column.append(_ABSENT)
+        
+        if self._hasher is not None:
+            self._hasher.update(_canonical_bytes(entry))
+            if extra:
+                self._hasher.update(_canonical_bytes(extra))
+    
+    def hexdigest(self) -> str:
+        """Digest of everything appended so far"""
+        if self._hasher is None:
+            raise ValueError("EvidenceStream was created without hashing")
+        return self._hasher.hexdigest()
+    
+    def rows(self) -> List[Dict[str, Any]]:
+        """Materialize entries as dicts, as they were recorded"""
+        columns = self.columns.items()
+        return [
+            {field: column[row] for field, column in columns if column[row] is not _ABSENT}
+            for row in range(self._rows)
+        ]
+
 class EvidencePackager:
     """Creates board-ready evidence packages"""
     
     def __init__(self, run_id: str):
         self.run_id = run_id
+        self.winner_line = ""
         self.evidence = {
-            "intents": [],
-            "orders": [],
-            "fills": [],
-            "arb_attempts": [],
-            "parity_diffs": [],
+            "intents": EvidenceStream(hashed=True),
+            "orders": EvidenceStream(hashed=True),
+            "fills": EvidenceStream(hashed=True),
+            "arb_attempts": EvidenceStream(),
+            "parity_diffs": EvidenceStream(),
             "kpis": {},
-            "pnl_ledger": [],
+            "pnl_ledger": EvidenceStream(),
             "metadata": {
                 "run_id": run_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _now_iso(),
                 "system_hash": self._generate_system_hash()
             }
         }
     
     def record_intent(self, intent: Dict[str, Any]):
         """Record trading intent"""
-        self.evidence["intents"].append({
-            **intent,
-            "recorded_at": datetime.utcnow().isoformat()
-        })
+        self.evidence["intents"].append(intent, recorded_at=_now_iso())
     
     def record_order(self, order: Dict[str, Any]):
         """Record order submission"""
-        self.evidence["orders"].append({
-            **order,
-            "recorded_at": datetime.utcnow().isoformat()
-        })
+        self.evidence["orders"].append(order, recorded_at=_now_iso())
     
     def record_fill(self, fill: Dict[str, Any]):
         """Record order fill"""
-        self.evidence["fills"].append({
-            **fill,
-            "recorded_at": datetime.utcnow().isoformat()
-        })
+        self.evidence["fills"].append(fill, recorded_at=_now_iso())
     
     def record_arbitrage_attempt(self, arb: Dict[str, Any]):
         """Record arbitrage attempt"""
-        self.evidence["arb_attempts"].append({
-            **arb,
-            "recorded_at": datetime.utcnow().isoformat()
-        })
+        self.evidence["arb_attempts"].append(arb, recorded_at=_now_iso())
     
     def record_parity_diff(self, diff: Dict[str, Any]):
         """Record parity difference"""
-        self.evidence["parity_diffs"].append({
-            **diff,
-            "recorded_at": datetime.utcnow().isoformat()
-        })
+        self.evidence["parity_diffs"].append(diff, recorded_at=_now_iso())
     
     def update_kpis(self, kpis: Dict[str, Any]):
         """Update KPIs"""
         self.evidence["kpis"] = {
             **kpis,
-            "updated_at": datetime.utcnow().isoformat()
+            "updated_at": _now_iso()
         }
     
     def record_pnl_entry(self, entry: Dict[str, Any]):
         """Record P&L entry"""
-        self.evidence["pnl_ledger"].append({
-            **entry,
-            "recorded_at": datetime.utcnow().isoformat()
-        })
+        self.evidence["pnl_ledger"].append(entry, recorded_at=_now_iso())
     
     def generate_evidence_manifest(self) -> Dict[str, Any]:
         """Generate evidence manifest"""
         return {
             "run_id": self.run_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "system_hash": self.evidence["metadata"]["system_hash"],
             "evidence_counts": {
                 "intents": len(self.evidence["intents"]),
@@ -876,25 +1398,27 @@ class EvidencePackager:
                 "pnl_entries": len(self.evidence["pnl_ledger"])
             },
             "data_integrity": {
-                "intents_hash": self._hash_data(self.evidence["intents"]),
-                "orders_hash": self._hash_data(self.evidence["orders"]),
-                "fills_hash": self._hash_data(self.evidence["fills"])
+                "hash_algorithm": _EVIDENCE_HASH_ALGORITHM,
+                "intents_hash": self.evidence["intents"].hexdigest(),
+                "orders_hash": self.evidence["orders"].hexdigest(),
+                "fills_hash": self.evidence["fills"].hexdigest()
             }
         }
     
     def generate_verdict(self, best_controller: str, rationale: str) -> str:
-        """Generate verdict markdown"""
+        """Generate verdict markdown; the winner line is also kept in self.winner_line"""
+        self.winner_line = f"**Winner**: **{best_controller}**"
         return f"""# ULTIMATE LYRA ECOSYSTEM - VERDICT
 
 ## Executive Summary
 
 **Run ID**: {self.run_id}  
-**Timestamp**: {datetime.utcnow().isoformat()}  
+**Timestamp**: {_now_iso()}  
 **System Hash**: {self.evidence["metadata"]["system_hash"][:16]}...
 
 ## Recommended Controller
 
-**Winner**: **{best_controller}**
+{self.winner_line}
 
 ## Rationale
 
@@ -917,7 +1441,7 @@ class EvidencePackager:
 
 ## Performance Metrics
 
-{json.dumps(self.evidence["kpis"], indent=2)}
+{_dumps_indented(self.evidence["kpis"])}
 
 ## Deployment Recommendation
 
@@ -932,13 +1456,8 @@ class EvidencePackager:
     
     def _generate_system_hash(self) -> str:
         """Generate system hash for integrity"""
-        system_data = f"{self.run_id}_{datetime.utcnow().isoformat()}"
+        system_data = f"{self.run_id}_{_now_iso()}"
         return hashlib.sha256(system_data.encode()).hexdigest()
-    
-    def _hash_data(self, data: List[Dict]) -> str:
-        """Hash data for integrity checking"""
-        data_str = json.dumps(data, sort_keys=True)
-        return hashlib.md5(data_str.encode()).hexdigest()
 
 # ============================================================================
 # MAIN ENHANCEMENT PACKAGE DEMO
@@ -960,6 +1479,8 @@ async def run_ultimate_enhancement_demo():
     
     registry = ExchangeRegistry()
     probe_results = await registry.sanity_probe_all("sandbox")
+    await registry.aclose()
+    await close_shared_connector()
     
     working_exchanges = sum(1 for result in probe_results.values() if result)
     total_exchanges = len(probe_results)
@@ -1029,6 +1550,7 @@ async def run_ultimate_enhancement_demo():
     
     # Simulate symbol stats
     symbols = ["BTC-USDT", "ETH-USDT", "ADA-USDT", "SOL-USDT", "DOGE-USDT"]
+    tick_ns = time.monotonic_ns()
     for i, symbol in enumerate(symbols):
         universe_builder.update_symbol_stats(symbol, {
             "24h_notional_usd": 10000000 - i * 1000000,
@@ -1037,7 +1559,7 @@ async def run_ultimate_enhancement_demo():
             "velocity_stddev": 1.0 + random.uniform(0, 2),
             "zero_fills_minutes": random.randint(0, 30),
             "spread_bps": random.uniform(10, 100)
-        })
+        }, now_ns=tick_ns)
     
     tiers = universe_builder.build_universe()
     
@@ -1051,7 +1573,7 @@ async def run_ultimate_enhancement_demo():
     print("5️⃣ SAFER MAX-INTENSITY EXECUTION")
     print("-" * 50)
     
-    execution_policy = ExecutionPolicy()
+    execution_policy = ExecutionPolicy(simulate_latency=True)
     execution_engine = SafeExecutionEngine(execution_policy)
     
     # Test execution
@@ -1098,7 +1620,7 @@ async def run_ultimate_enhancement_demo():
     print()
     
     print("📄 Verdict generated:")
-    print(verdict.split('\n')[6])  # Show winner line
+    print(evidence_packager.winner_line)
     print()
     
     # Summary
@@ -1126,5 +1648,17 @@ async def run_ultimate_enhancement_demo():
         "overall_status": "✅ ENHANCEMENT PACKAGE COMPLETE"
     }
 
+def install_uvloop() -> bool:
+    """Use uvloop's event loop policy when available (Linux/macOS)"""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return UVLOOP_AVAILABLE
+
+def main(use_uvloop: bool = True):
+    """Entry point; pass use_uvloop=False to keep the default asyncio loop"""
+    if use_uvloop:
+        install_uvloop()
+    return asyncio.run(run_ultimate_enhancement_demo())
+
 if __name__ == "__main__":
-    asyncio.run(run_ultimate_enhancement_demo())
+    main()
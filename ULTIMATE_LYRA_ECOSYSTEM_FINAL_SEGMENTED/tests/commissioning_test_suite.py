@@ -18,16 +18,34 @@ Test Categories:
 """
 
 import asyncio
+import contextlib
+import dataclasses
+import functools
+import hmac
 import json
 import time
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import unittest
+from types import MappingProxyType
+import numpy as np
 from unittest.mock import Mock, patch
 import sys
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -40,13 +58,62 @@ from security.vault_manager import VaultManager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Monotonic, nanosecond-resolution clock for latency measurements
+_ns = time.perf_counter_ns
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a _ns() reading"""
+    return (_ns() - start_ns) / 1e6
+
+# Aggregate results, plus one JSON line per test written as each test finishes
+RESULTS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE = os.path.join(RESULTS_DIR, "commissioning_test_results.json")
+DETAILS_LOG_FILE = os.path.join(RESULTS_DIR, "commissioning_test_results.jsonl")
+
+# Fields every market data tick must carry
+REQUIRED_MARKET_DATA_FIELDS = frozenset({"price", "volume", "timestamp", "bid", "ask"})
+
+# Fields a generated intent must carry, and the fields Intent declares
+REQUIRED_INTENT_FIELDS = frozenset({"strategy", "symbol", "side", "confidence", "reasoning"})
+_INTENT_FIELD_NAMES = frozenset(field.name for field in dataclasses.fields(Intent))
+
+# Components are shared across suite runs in the same process (read-mostly);
+# call reset_shared_components() when a run needs a clean slate
+@functools.lru_cache(maxsize=1)
+def _get_conductor() -> AIOrchestralConductor:
+    return AIOrchestralConductor()
+
+@functools.lru_cache(maxsize=1)
+def _get_engine() -> SmartExecutionEngine:
+    return SmartExecutionEngine()
+
+def reset_shared_components():
+    """Drop the shared conductor and execution engine so the next run rebuilds them"""
+    _get_conductor.cache_clear()
+    _get_engine.cache_clear()
+
 class CommissioningTestSuite:
     """Comprehensive commissioning test suite"""
     
-    def __init__(self):
+    __slots__ = (
+        "test_results",
+        "conductor",
+        "execution_engine",
+        "vault_manager",
+        "commissioning_tool",
+        "test_config",
+        "_hmac_template",
+        "_intent_template",
+        "_details_log"
+    )
+    
+    def __init__(self, fast_mode: bool = True):
+        # One wall-clock read per suite, shared by the results and the intent template
+        start_time = datetime.utcnow().isoformat()
+        
         self.test_results = {
             "test_suite": "Commissioning Test Suite",
-            "start_time": datetime.utcnow().isoformat(),
+            "start_time": start_time,
             "total_tests": 0,
             "passed_tests": 0,
             "failed_tests": 0,
@@ -59,8 +126,11 @@ class CommissioningTestSuite:
         self.vault_manager = None
         self.commissioning_tool = None
         
-        # Test configuration
-        self.test_config = {
+        # Open only while run_all_tests is running
+        self._details_log = None
+        
+        # Test configuration (read-only at the top level)
+        self.test_config = MappingProxyType({
             "sandbox_endpoints": {
                 "binance_testnet": "https://testnet.binance.vision",
                 "coinbase_sandbox": "https://api-public.sandbox.pro.coinbase.com",
@@ -77,8 +147,28 @@ class CommissioningTestSuite:
                 "order_latency": 500,  # ms
                 "success_rate": 0.95,
                 "uptime": 0.999
-            }
-        }
+            },
+            # Cap on in-flight conductor calls in the throughput test
+            "max_concurrency": 8,
+            # Account simulated API latency without sleeping through it
+            "fast_mode": fast_mode,
+            "api_signing_key": "test_secret_key"
+        })
+        
+        # Keyed HMAC-SHA256 state; copy() per message skips re-deriving the key pads
+        self._hmac_template = hmac.new(self.test_config["api_signing_key"].encode('utf-8'), digestmod="sha256")
+        
+        # Base intent for admission/risk tests; vary it with dataclasses.replace
+        self._intent_template = Intent(
+            strategy="SMC_X",
+            symbol="BTCUSDT",
+            side=IntentAction.BUY,
+            size_hint=0.1,
+            confidence=0.0,
+            model_version="v2.1",
+            timestamp=start_time,
+            reasoning=""
+        )
     
     async def run_all_tests(self) -> Dict:
         """Run all commissioning tests"""
@@ -86,18 +176,40 @@ class CommissioningTestSuite:
         logger.info("=" * 60)
         
         try:
+            # The details log is best-effort: without it the suite still runs
+            try:
+                self._details_log = open(DETAILS_LOG_FILE, 'wb')
+            except OSError as e:
+                logger.warning(f"⚠️ Test details log unavailable: {str(e)}")
+            
             # Initialize components
             await self._initialize_components()
             
-            # Run test categories
-            await self._test_connectivity_auth()
-            await self._test_market_data_processing()
-            await self._test_ai_conductor()
-            await self._test_admission_control()
-            await self._test_execution_engine()
-            await self._test_risk_management()
-            await self._test_performance()
-            await self._test_failover_recovery()
+            # Run stateless test categories concurrently (tests within a
+            # category stay sequential); they mostly wait rather than compute,
+            # so they are not capped by CPU count
+            (connectivity, market_data, ai_conductor, admission_control,
+             execution_engine, performance) = await asyncio.gather(
+                self._test_connectivity_auth(),
+                self._test_market_data_processing(),
+                self._test_ai_conductor(),
+                self._test_admission_control(),
+                self._test_execution_engine(),
+                self._test_performance()
+            )
+            
+            # Stateful categories run serially afterwards: drawdown protection
+            # patches the shared portfolio state and failover restarts the
+            # shared conductor
+            risk_management = await self._test_risk_management()
+            failover_recovery = await self._test_failover_recovery()
+            
+            # Record results in declaration order
+            category_results = [
+                connectivity, market_data, ai_conductor, admission_control,
+                execution_engine, risk_management, performance, failover_recovery
+            ]
+            self._record_results([test_result for results in category_results for test_result in results])
             
             # Finalize results
             self._finalize_results()
@@ -109,6 +221,11 @@ class CommissioningTestSuite:
             logger.error(f"❌ Test suite failed: {str(e)}")
             self.test_results["error"] = str(e)
             return self.test_results
+        
+        finally:
+            if self._details_log is not None:
+                self._details_log.close()
+                self._details_log = None
     
     async def _initialize_components(self):
         """Initialize all system components for testing"""
@@ -116,10 +233,10 @@ class CommissioningTestSuite:
         
         try:
             # Initialize AI Conductor
-            self.conductor = AIOrchestralConductor()
+            self.conductor = _get_conductor()
             
             # Initialize Execution Engine
-            self.execution_engine = SmartExecutionEngine()
+            self.execution_engine = _get_engine()
             
             # Initialize Vault Manager (mock mode)
             self.vault_manager = None  # Mock for testing
@@ -133,47 +250,30 @@ class CommissioningTestSuite:
             logger.error(f"❌ Component initialization failed: {str(e)}")
             raise e
     
-    async def _test_connectivity_auth(self):
+    async def _test_connectivity_auth(self) -> List[Dict]:
         """Test connectivity and authentication"""
         logger.info("🔗 Testing Connectivity & Authentication...")
         
-        # Test 1: Binance Testnet Connection
-        await self._run_test(
-            "Binance Testnet Connectivity",
-            self._test_binance_testnet_connection
-        )
-        
-        # Test 2: Coinbase Sandbox Connection
-        await self._run_test(
-            "Coinbase Sandbox Connectivity",
-            self._test_coinbase_sandbox_connection
-        )
-        
-        # Test 3: Mock Exchange Adapters
-        await self._run_test(
-            "Mock Exchange Adapters",
-            self._test_mock_exchange_adapters
-        )
-        
-        # Test 4: API Signature Validation
-        await self._run_test(
-            "API Signature Validation",
-            self._test_api_signature_validation
-        )
-        
-        # Test 5: Rate Limit Handling
-        await self._run_test(
-            "Rate Limit Handling",
-            self._test_rate_limit_handling
-        )
+        return await self._run_tests([
+            # Test 1: Binance Testnet Connection
+            ("Binance Testnet Connectivity", self._test_binance_testnet_connection),
+            # Test 2: Coinbase Sandbox Connection
+            ("Coinbase Sandbox Connectivity", self._test_coinbase_sandbox_connection),
+            # Test 3: Mock Exchange Adapters
+            ("Mock Exchange Adapters", self._test_mock_exchange_adapters),
+            # Test 4: API Signature Validation
+            ("API Signature Validation", self._test_api_signature_validation),
+            # Test 5: Rate Limit Handling
+            ("Rate Limit Handling", self._test_rate_limit_handling)
+        ])
     
     async def _test_binance_testnet_connection(self) -> Tuple[bool, str, float]:
         """Test Binance testnet connection"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Mock Binance testnet API call
-            await asyncio.sleep(0.05)  # Simulate API latency
+            simulated_ms = await self._simulate_api_latency(0.05)
             
             # Simulate successful connection
             response = {
@@ -183,7 +283,7 @@ class CommissioningTestSuite:
                 ]
             }
             
-            latency = (time.time() - start_time) * 1000
+            latency = _elapsed_ms(start_ns) + simulated_ms
             
             if latency < self.test_config["performance_targets"]["api_latency"]:
                 return True, f"Connected successfully (latency: {latency:.1f}ms)", latency
@@ -191,15 +291,15 @@ class CommissioningTestSuite:
                 return False, f"High latency: {latency:.1f}ms", latency
                 
         except Exception as e:
-            return False, f"Connection failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Connection failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_coinbase_sandbox_connection(self) -> Tuple[bool, str, float]:
         """Test Coinbase sandbox connection"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Mock Coinbase sandbox API call
-            await asyncio.sleep(0.08)  # Simulate API latency
+            simulated_ms = await self._simulate_api_latency(0.08)
             
             # Simulate successful connection
             response = {
@@ -207,7 +307,7 @@ class CommissioningTestSuite:
                 "pagination": {"ending_before": None, "starting_after": None, "limit": 25}
             }
             
-            latency = (time.time() - start_time) * 1000
+            latency = _elapsed_ms(start_ns) + simulated_ms
             
             if latency < self.test_config["performance_targets"]["api_latency"]:
                 return True, f"Sandbox connected (latency: {latency:.1f}ms)", latency
@@ -215,22 +315,26 @@ class CommissioningTestSuite:
                 return False, f"High latency: {latency:.1f}ms", latency
                 
         except Exception as e:
-            return False, f"Sandbox connection failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Sandbox connection failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_mock_exchange_adapters(self) -> Tuple[bool, str, float]:
         """Test mock exchange adapters"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             mock_exchanges = self.test_config["sandbox_endpoints"]["mock_exchanges"]
-            successful_connections = 0
             
-            for exchange in mock_exchanges:
-                # Mock connection test
-                await asyncio.sleep(0.02)  # Simulate connection time
-                successful_connections += 1
+            # Probe all exchanges concurrently; simulated waits overlap, so the
+            # slowest one bounds the latency
+            results = await asyncio.gather(
+                *(self._probe_exchange(exchange) for exchange in mock_exchanges),
+                return_exceptions=True
+            )
+            connected = [r for r in results if not isinstance(r, BaseException)]
+            successful_connections = len(connected)
+            simulated_ms = max(connected, default=0.0)
             
-            latency = (time.time() - start_time) * 1000
+            latency = _elapsed_ms(start_ns) + simulated_ms
             
             if successful_connections == len(mock_exchanges):
                 return True, f"All {len(mock_exchanges)} mock exchanges connected", latency
@@ -238,94 +342,96 @@ class CommissioningTestSuite:
                 return False, f"Only {successful_connections}/{len(mock_exchanges)} connected", latency
                 
         except Exception as e:
-            return False, f"Mock adapter test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Mock adapter test failed: {str(e)}", _elapsed_ms(start_ns)
+    
+    async def _probe_exchange(self, exchange: str) -> float:
+        """Mock connection test for one exchange; returns skipped simulated ms"""
+        return await self._simulate_api_latency(0.02)  # Simulate connection time
+    
+    async def _simulate_api_latency(self, seconds: float) -> float:
+        """Stand in for a mock API call's latency.
+        
+        Sleeps for real unless fast_mode is set; returns the simulated time in
+        ms that was skipped (0 when slept), to add to the measured latency.
+        """
+        if self.test_config["fast_mode"]:
+            return seconds * 1000
+        await asyncio.sleep(seconds)
+        return 0.0
     
     async def _test_api_signature_validation(self) -> Tuple[bool, str, float]:
         """Test API signature validation"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test HMAC signature generation
-            import hmac
-            import hashlib
-            
-            test_key = "test_secret_key"
             test_message = "symbol=BTCUSDT&side=BUY&type=MARKET&quantity=0.1&timestamp=1234567890"
             
             # Generate signature
-            signature = hmac.new(
-                test_key.encode('utf-8'),
-                test_message.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-            
-            # Validate signature format
-            if len(signature) == 64 and all(c in '0123456789abcdef' for c in signature):
-                latency = (time.time() - start_time) * 1000
+            signature = self._sign(test_message)
+            
+            # Validate signature format: 64 lowercase hex chars (strip is one C-level pass)
+            if len(signature) == 64 and not signature.strip("0123456789abcdef"):
+                latency = _elapsed_ms(start_ns)
                 return True, f"Signature validation passed: {signature[:16]}...", latency
             else:
-                return False, "Invalid signature format", (time.time() - start_time) * 1000
+                return False, "Invalid signature format", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Signature validation failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Signature validation failed: {str(e)}", _elapsed_ms(start_ns)
+    
+    def _sign(self, message: str) -> str:
+        """HMAC-SHA256 hex signature of message with the test signing key"""
+        mac = self._hmac_template.copy()
+        mac.update(message.encode('utf-8'))
+        return mac.hexdigest()
     
     async def _test_rate_limit_handling(self) -> Tuple[bool, str, float]:
         """Test rate limit handling"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test token bucket rate limiter
             from core.ai_orchestra_conductor import TokenBucket
             
-            # Create rate limiter: 5 tokens, 1 token per second
-            rate_limiter = TokenBucket(capacity=5, refill_rate=1.0)
+            # Create rate limiter: 5 tokens, 1 token per second, on a virtual clock
+            clock = [0.0]
+            rate_limiter = TokenBucket(capacity=5, refill_rate=1.0, time_fn=lambda: clock[0])
             
-            # Consume all tokens
-            consumed = 0
-            for i in range(10):
-                if rate_limiter.consume(1):
-                    consumed += 1
+            # Try to consume 10 tokens in one call
+            consumed = rate_limiter.consume_up_to(10)
             
             # Should consume exactly 5 tokens (capacity)
             if consumed == 5:
-                # Wait for refill and test again
-                await asyncio.sleep(1.1)
+                # Advance past one refill interval and test again
+                clock[0] += 1.1
                 if rate_limiter.consume(1):
-                    latency = (time.time() - start_time) * 1000
+                    latency = _elapsed_ms(start_ns)
                     return True, f"Rate limiter working correctly (consumed {consumed}/10)", latency
                 else:
-                    return False, "Rate limiter refill failed", (time.time() - start_time) * 1000
+                    return False, "Rate limiter refill failed", _elapsed_ms(start_ns)
             else:
-                return False, f"Rate limiter consumed {consumed}/5 tokens", (time.time() - start_time) * 1000
+                return False, f"Rate limiter consumed {consumed}/5 tokens", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Rate limit test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Rate limit test failed: {str(e)}", _elapsed_ms(start_ns)
     
-    async def _test_market_data_processing(self):
+    async def _test_market_data_processing(self) -> List[Dict]:
         """Test market data processing"""
         logger.info("📊 Testing Market Data Processing...")
         
-        # Test 6: Market Data Ingestion
-        await self._run_test(
-            "Market Data Ingestion",
-            self._test_market_data_ingestion
-        )
-        
-        # Test 7: Order Book Processing
-        await self._run_test(
-            "Order Book Processing",
-            self._test_order_book_processing
-        )
-        
-        # Test 8: Price Feed Validation
-        await self._run_test(
-            "Price Feed Validation",
-            self._test_price_feed_validation
-        )
+        return await self._run_tests([
+            # Test 6: Market Data Ingestion
+            ("Market Data Ingestion", self._test_market_data_ingestion),
+            # Test 7: Order Book Processing
+            ("Order Book Processing", self._test_order_book_processing),
+            # Test 8: Price Feed Validation
+            ("Price Feed Validation", self._test_price_feed_validation)
+        ])
     
     async def _test_market_data_ingestion(self) -> Tuple[bool, str, float]:
         """Test market data ingestion"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Simulate market data feed
@@ -340,60 +446,64 @@ class CommissioningTestSuite:
             }
             
             # Validate data structure
-            required_fields = ["price", "volume", "timestamp", "bid", "ask"]
             for symbol, data in market_data.items():
-                for field in required_fields:
-                    if field not in data:
-                        return False, f"Missing field {field} in {symbol}", (time.time() - start_time) * 1000
+                missing = REQUIRED_MARKET_DATA_FIELDS - data.keys()
+                if missing:
+                    return False, f"Missing fields {sorted(missing)} in {symbol}", _elapsed_ms(start_ns)
             
             # Validate data types and ranges
             for symbol, data in market_data.items():
                 if not isinstance(data["price"], (int, float)) or data["price"] <= 0:
-                    return False, f"Invalid price for {symbol}", (time.time() - start_time) * 1000
+                    return False, f"Invalid price for {symbol}", _elapsed_ms(start_ns)
                 
                 if data["bid"] >= data["ask"]:
-                    return False, f"Invalid spread for {symbol}", (time.time() - start_time) * 1000
+                    return False, f"Invalid spread for {symbol}", _elapsed_ms(start_ns)
             
-            latency = (time.time() - start_time) * 1000
+            latency = _elapsed_ms(start_ns)
             return True, f"Market data ingestion successful for {len(market_data)} symbols", latency
             
         except Exception as e:
-            return False, f"Market data ingestion failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Market data ingestion failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_order_book_processing(self) -> Tuple[bool, str, float]:
         """Test order book processing"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Update market data in execution engine
             bids = [(44999.0, 1.5), (44998.0, 2.0), (44997.0, 1.0)]
             asks = [(45001.0, 1.2), (45002.0, 1.8), (45003.0, 0.8)]
             
-            self.execution_engine.market_data.update_order_book("BTCUSDT", bids, asks)
+            md = self.execution_engine.market_data
+            md.update_order_book("BTCUSDT", bids, asks)
+            
+            # Top of book, mid price and spread from one lookup
+            top_of_book = md.get_top_of_book("BTCUSDT")
+            if top_of_book is None:
+                return False, "Order book missing after update", _elapsed_ms(start_ns)
+            best_bid, best_ask, mid_price, spread = top_of_book
             
             # Test mid price calculation
-            mid_price = self.execution_engine.market_data.get_mid_price("BTCUSDT")
             expected_mid = (44999.0 + 45001.0) / 2
             
-            if abs(mid_price - expected_mid) < 0.01:
+            if best_bid == 44999.0 and best_ask == 45001.0 and abs(mid_price - expected_mid) < 0.01:
                 # Test spread calculation
-                spread = self.execution_engine.market_data.get_spread("BTCUSDT")
                 expected_spread = 45001.0 - 44999.0
                 
                 if abs(spread - expected_spread) < 0.01:
-                    latency = (time.time() - start_time) * 1000
+                    latency = _elapsed_ms(start_ns)
                     return True, f"Order book processing correct (mid: {mid_price}, spread: {spread})", latency
                 else:
-                    return False, f"Incorrect spread calculation: {spread}", (time.time() - start_time) * 1000
+                    return False, f"Incorrect spread calculation: {spread}", _elapsed_ms(start_ns)
             else:
-                return False, f"Incorrect mid price calculation: {mid_price}", (time.time() - start_time) * 1000
+                return False, f"Incorrect mid price calculation: {mid_price}", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Order book processing failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Order book processing failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_price_feed_validation(self) -> Tuple[bool, str, float]:
         """Test price feed validation"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test price validation logic
@@ -405,52 +515,40 @@ class CommissioningTestSuite:
                 ("INVALID", 100.0, False),    # Invalid: unknown symbol
             ]
             
-            validation_results = []
-            for symbol, price, expected_valid in test_prices:
-                # Simple validation logic
-                is_valid = (
-                    symbol in ["BTCUSDT", "ETHUSDT", "ADAUSDT"] and
-                    isinstance(price, (int, float)) and
-                    price > 0
-                )
-                
-                validation_results.append(is_valid == expected_valid)
+            symbols, prices, expected = zip(*test_prices)
+            
+            # Simple validation logic, one vectorized pass over all cases
+            is_valid = (
+                np.isin(np.array(symbols), self.test_config["test_symbols"]) &
+                (np.array(prices, dtype=np.float64) > 0)
+            )
+            failed_count = int(np.count_nonzero(is_valid != np.array(expected, dtype=bool)))
             
-            if all(validation_results):
-                latency = (time.time() - start_time) * 1000
+            if failed_count == 0:
+                latency = _elapsed_ms(start_ns)
                 return True, f"Price validation passed for {len(test_prices)} test cases", latency
             else:
-                failed_count = sum(1 for r in validation_results if not r)
-                return False, f"{failed_count}/{len(test_prices)} validation tests failed", (time.time() - start_time) * 1000
+                return False, f"{failed_count}/{len(test_prices)} validation tests failed", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Price feed validation failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Price feed validation failed: {str(e)}", _elapsed_ms(start_ns)
     
-    async def _test_ai_conductor(self):
+    async def _test_ai_conductor(self) -> List[Dict]:
         """Test AI Orchestra Conductor"""
         logger.info("🎼 Testing AI Orchestra Conductor...")
         
-        # Test 9: AI Model Loading
-        await self._run_test(
-            "AI Model Loading",
-            self._test_ai_model_loading
-        )
-        
-        # Test 10: Intent Generation
-        await self._run_test(
-            "Intent Generation",
-            self._test_intent_generation
-        )
-        
-        # Test 11: Multi-Model Analysis
-        await self._run_test(
-            "Multi-Model Analysis",
-            self._test_multi_model_analysis
-        )
+        return await self._run_tests([
+            # Test 9: AI Model Loading
+            ("AI Model Loading", self._test_ai_model_loading),
+            # Test 10: Intent Generation
+            ("Intent Generation", self._test_intent_generation),
+            # Test 11: Multi-Model Analysis
+            ("Multi-Model Analysis", self._test_multi_model_analysis)
+        ])
     
     async def _test_ai_model_loading(self) -> Tuple[bool, str, float]:
         """Test AI model loading"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Check if conductor has loaded models
@@ -459,19 +557,19 @@ class CommissioningTestSuite:
                 expected_models = 7  # Expected number of AI models
                 
                 if loaded_models >= expected_models:
-                    latency = (time.time() - start_time) * 1000
+                    latency = _elapsed_ms(start_ns)
                     return True, f"Loaded {loaded_models} AI models successfully", latency
                 else:
-                    return False, f"Only {loaded_models}/{expected_models} models loaded", (time.time() - start_time) * 1000
+                    return False, f"Only {loaded_models}/{expected_models} models loaded", _elapsed_ms(start_ns)
             else:
-                return False, "No AI models loaded", (time.time() - start_time) * 1000
+                return False, "No AI models loaded", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"AI model loading failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"AI model loading failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_intent_generation(self) -> Tuple[bool, str, float]:
         """Test intent generation"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test market data for intent generation
@@ -497,24 +595,24 @@ class CommissioningTestSuite:
                     intent = approved_intents[0].intent
                     
                     # Validate intent structure
-                    required_fields = ["strategy", "symbol", "side", "confidence", "reasoning"]
-                    for field in required_fields:
-                        if not hasattr(intent, field):
-                            return False, f"Intent missing field: {field}", (time.time() - start_time) * 1000
+                    field_names = _INTENT_FIELD_NAMES if type(intent) is Intent else vars(intent).keys()
+                    missing = REQUIRED_INTENT_FIELDS - field_names
+                    if missing:
+                        return False, f"Intent missing fields: {sorted(missing)}", _elapsed_ms(start_ns)
                     
-                    latency = (time.time() - start_time) * 1000
+                    latency = _elapsed_ms(start_ns)
                     return True, f"Generated {len(approved_intents)} valid intents", latency
                 else:
-                    return False, "No intents approved by admission control", (time.time() - start_time) * 1000
+                    return False, "No intents approved by admission control", _elapsed_ms(start_ns)
             else:
-                return False, "No decisions generated", (time.time() - start_time) * 1000
+                return False, "No decisions generated", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Intent generation failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Intent generation failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_multi_model_analysis(self) -> Tuple[bool, str, float]:
         """Test multi-model analysis"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test data for analysis
@@ -527,105 +625,77 @@ class CommissioningTestSuite:
                 "sentiment": 0.7
             }
             
-            # Test individual analysis functions
-            price_analysis = self.conductor._predict_price_direction(test_data)
-            volatility_analysis = self.conductor._predict_volatility(test_data)
-            sentiment_analysis = self.conductor._analyze_sentiment(test_data)
-            pattern_analysis = self.conductor._recognize_patterns(test_data)
+            # Test individual analysis functions (synchronous, microsecond-scale
+            # models, so they are called inline rather than fanned out to threads)
+            conductor = self.conductor
+            analyses = [
+                conductor._predict_price_direction(test_data),
+                conductor._predict_volatility(test_data),
+                conductor._analyze_sentiment(test_data),
+                conductor._recognize_patterns(test_data)
+            ]
             
             # Validate analysis results
-            analyses = [price_analysis, volatility_analysis, sentiment_analysis, pattern_analysis]
-            
-            for analysis in analyses:
-                if not isinstance(analysis, dict) or "confidence" not in analysis:
-                    return False, "Invalid analysis result structure", (time.time() - start_time) * 1000
+            if not all(isinstance(analysis, dict) and "confidence" in analysis for analysis in analyses):
+                return False, "Invalid analysis result structure", _elapsed_ms(start_ns)
             
-            latency = (time.time() - start_time) * 1000
+            latency = _elapsed_ms(start_ns)
             return True, f"Multi-model analysis completed ({len(analyses)} models)", latency
             
         except Exception as e:
-            return False, f"Multi-model analysis failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Multi-model analysis failed: {str(e)}", _elapsed_ms(start_ns)
     
-    async def _test_admission_control(self):
+    async def _test_admission_control(self) -> List[Dict]:
         """Test admission control and rate limiting"""
         logger.info("🚪 Testing Admission Control...")
         
-        # Test 12: Confidence Threshold Check
-        await self._run_test(
-            "Confidence Threshold Check",
-            self._test_confidence_threshold
-        )
-        
-        # Test 13: Portfolio Risk Check
-        await self._run_test(
-            "Portfolio Risk Check",
-            self._test_portfolio_risk_check
-        )
-        
-        # Test 14: Circuit Breaker Functionality
-        await self._run_test(
-            "Circuit Breaker Functionality",
-            self._test_circuit_breaker
-        )
+        return await self._run_tests([
+            # Test 12: Confidence Threshold Check
+            ("Confidence Threshold Check", self._test_confidence_threshold),
+            # Test 13: Portfolio Risk Check
+            ("Portfolio Risk Check", self._test_portfolio_risk_check),
+            # Test 14: Circuit Breaker Functionality
+            ("Circuit Breaker Functionality", self._test_circuit_breaker)
+        ])
     
     async def _test_confidence_threshold(self) -> Tuple[bool, str, float]:
         """Test confidence threshold checking"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Create test intents with different confidence levels
-            high_confidence_intent = Intent(
-                strategy="SMC_X",
-                symbol="BTCUSDT",
-                side=IntentAction.BUY,
-                size_hint=0.1,
-                confidence=0.85,  # High confidence
-                model_version="v2.1",
-                timestamp=datetime.utcnow().isoformat(),
-                reasoning="Strong bullish signals"
-            )
+            high_confidence_intent = dataclasses.replace(
+                self._intent_template, confidence=0.85, reasoning="Strong bullish signals"
+            )  # High confidence
             
-            low_confidence_intent = Intent(
-                strategy="SMC_X",
-                symbol="BTCUSDT",
-                side=IntentAction.BUY,
-                size_hint=0.1,
-                confidence=0.45,  # Low confidence
-                model_version="v2.1",
-                timestamp=datetime.utcnow().isoformat(),
-                reasoning="Weak signals"
-            )
+            low_confidence_intent = dataclasses.replace(
+                self._intent_template, confidence=0.45, reasoning="Weak signals"
+            )  # Low confidence
             
             # Test admission control
-            high_conf_result = await self.conductor.admission_controller.admit_intent(high_confidence_intent)
-            low_conf_result = await self.conductor.admission_controller.admit_intent(low_confidence_intent)
+            ac = self.conductor.admission_controller
+            high_conf_result = await ac.admit_intent(high_confidence_intent)
+            low_conf_result = await ac.admit_intent(low_confidence_intent)
             
             # High confidence should be approved, low confidence should be rejected
             if (high_conf_result.result.value in ["APPROVE", "QUEUE"] and 
                 low_conf_result.result.value == "REJECT"):
-                latency = (time.time() - start_time) * 1000
+                latency = _elapsed_ms(start_ns)
                 return True, "Confidence threshold check working correctly", latency
             else:
-                return False, f"Unexpected results: high={high_conf_result.result.value}, low={low_conf_result.result.value}", (time.time() - start_time) * 1000
+                return False, f"Unexpected results: high={high_conf_result.result.value}, low={low_conf_result.result.value}", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Confidence threshold test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Confidence threshold test failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_portfolio_risk_check(self) -> Tuple[bool, str, float]:
         """Test portfolio risk checking"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Create test intent
-            test_intent = Intent(
-                strategy="SMC_X",
-                symbol="BTCUSDT",
-                side=IntentAction.BUY,
-                size_hint=0.1,
-                confidence=0.80,
-                model_version="v2.1",
-                timestamp=datetime.utcnow().isoformat(),
-                reasoning="Test intent for risk check"
+            test_intent = dataclasses.replace(
+                self._intent_template, confidence=0.80, reasoning="Test intent for risk check"
             )
             
             # Test portfolio risk check
@@ -636,25 +706,26 @@ class CommissioningTestSuite:
                 is_valid, reason = risk_check
                 
                 if isinstance(is_valid, bool) and isinstance(reason, str):
-                    latency = (time.time() - start_time) * 1000
+                    latency = _elapsed_ms(start_ns)
                     return True, f"Portfolio risk check completed: {reason}", latency
                 else:
-                    return False, "Invalid risk check return types", (time.time() - start_time) * 1000
+                    return False, "Invalid risk check return types", _elapsed_ms(start_ns)
             else:
-                return False, "Invalid risk check return format", (time.time() - start_time) * 1000
+                return False, "Invalid risk check return format", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Portfolio risk check failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Portfolio risk check failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_circuit_breaker(self) -> Tuple[bool, str, float]:
         """Test circuit breaker functionality"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             from core.ai_orchestra_conductor import CircuitBreaker
             
-            # Create circuit breaker with low threshold for testing
-            breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=1)
+            # Create circuit breaker with low threshold for testing, on a virtual clock
+            clock = [0.0]
+            breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=1, time_fn=lambda: clock[0])
             
             # Test normal operation
             def successful_operation():
@@ -662,73 +733,59 @@ class CommissioningTestSuite:
             
             result1 = breaker.call(successful_operation)
             if result1 != "success":
-                return False, "Circuit breaker failed on successful operation", (time.time() - start_time) * 1000
+                return False, "Circuit breaker failed on successful operation", _elapsed_ms(start_ns)
             
             # Test failure handling
             def failing_operation():
                 raise Exception("Test failure")
             
-            failure_count = 0
-            for i in range(5):
-                try:
-                    breaker.call(failing_operation)
-                except Exception:
-                    failure_count += 1
+            failure_count = sum(1 for _ in range(5) if not breaker.call_safe(failing_operation)[0])
             
             # Circuit breaker should be OPEN after 3 failures
             if breaker.state == "OPEN":
                 # Test that calls are blocked
                 try:
                     breaker.call(successful_operation)
-                    return False, "Circuit breaker should block calls when OPEN", (time.time() - start_time) * 1000
+                    return False, "Circuit breaker should block calls when OPEN", _elapsed_ms(start_ns)
                 except Exception:
                     # This is expected
                     pass
                 
-                # Wait for recovery timeout
-                await asyncio.sleep(1.1)
+                # Advance past the recovery timeout
+                clock[0] += 1.1
                 
                 # Should allow one call in HALF_OPEN state
                 try:
                     result = breaker.call(successful_operation)
                     if result == "success" and breaker.state == "CLOSED":
-                        latency = (time.time() - start_time) * 1000
+                        latency = _elapsed_ms(start_ns)
                         return True, f"Circuit breaker working correctly (failed {failure_count} times)", latency
                     else:
-                        return False, f"Circuit breaker recovery failed: state={breaker.state}", (time.time() - start_time) * 1000
+                        return False, f"Circuit breaker recovery failed: state={breaker.state}", _elapsed_ms(start_ns)
                 except Exception as e:
-                    return False, f"Circuit breaker recovery call failed: {str(e)}", (time.time() - start_time) * 1000
+                    return False, f"Circuit breaker recovery call failed: {str(e)}", _elapsed_ms(start_ns)
             else:
-                return False, f"Circuit breaker should be OPEN after failures, but state is {breaker.state}", (time.time() - start_time) * 1000
+                return False, f"Circuit breaker should be OPEN after failures, but state is {breaker.state}", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Circuit breaker test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Circuit breaker test failed: {str(e)}", _elapsed_ms(start_ns)
     
-    async def _test_execution_engine(self):
+    async def _test_execution_engine(self) -> List[Dict]:
         """Test smart execution engine"""
         logger.info("⚡ Testing Smart Execution Engine...")
         
-        # Test 15: Execution Plan Creation
-        await self._run_test(
-            "Execution Plan Creation",
-            self._test_execution_plan_creation
-        )
-        
-        # Test 16: TWAP Algorithm
-        await self._run_test(
-            "TWAP Algorithm",
-            self._test_twap_algorithm
-        )
-        
-        # Test 17: Smart Order Routing
-        await self._run_test(
-            "Smart Order Routing",
-            self._test_smart_order_routing
-        )
+        return await self._run_tests([
+            # Test 15: Execution Plan Creation
+            ("Execution Plan Creation", self._test_execution_plan_creation),
+            # Test 16: TWAP Algorithm
+            ("TWAP Algorithm", self._test_twap_algorithm),
+            # Test 17: Smart Order Routing
+            ("Smart Order Routing", self._test_smart_order_routing)
+        ])
     
     async def _test_execution_plan_creation(self) -> Tuple[bool, str, float]:
         """Test execution plan creation"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Create test child orders
@@ -749,29 +806,30 @@ class CommissioningTestSuite:
             required_fields = ["intent_id", "symbol", "side", "total_size", "algorithm", "exchange"]
             for field in required_fields:
                 if not hasattr(plan, field):
-                    return False, f"Execution plan missing field: {field}", (time.time() - start_time) * 1000
+                    return False, f"Execution plan missing field: {field}", _elapsed_ms(start_ns)
             
             # Validate plan values
             if plan.total_size != 0.5:
-                return False, f"Incorrect total size: {plan.total_size}", (time.time() - start_time) * 1000
+                return False, f"Incorrect total size: {plan.total_size}", _elapsed_ms(start_ns)
             
             if plan.symbol != "BTCUSDT":
-                return False, f"Incorrect symbol: {plan.symbol}", (time.time() - start_time) * 1000
+                return False, f"Incorrect symbol: {plan.symbol}", _elapsed_ms(start_ns)
             
-            latency = (time.time() - start_time) * 1000
+            latency = _elapsed_ms(start_ns)
             return True, f"Execution plan created successfully (algorithm: {plan.algorithm.value})", latency
             
         except Exception as e:
-            return False, f"Execution plan creation failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Execution plan creation failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_twap_algorithm(self) -> Tuple[bool, str, float]:
         """Test TWAP algorithm"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Create TWAP execution plan
             from trading.smart_execution_engine import ExecutionPlan, ExecutionAlgorithm
             
+            now = datetime.utcnow()
             plan = ExecutionPlan(
                 intent_id="twap_test",
                 symbol="BTCUSDT",
@@ -781,8 +839,8 @@ class CommissioningTestSuite:
                 exchange="binance",
                 strategy="test",
                 child_orders=[],
-                start_time=datetime.utcnow().isoformat(),
-                end_time=(datetime.utcnow() + timedelta(minutes=5)).isoformat()
+                start_time=now.isoformat(),
+                end_time=(now + timedelta(minutes=5)).isoformat()
             )
             
             # Execute TWAP
@@ -790,77 +848,66 @@ class CommissioningTestSuite:
             
             # Validate TWAP execution
             if orders:
-                total_size = sum(order.size for order in orders)
+                sizes = np.fromiter((order.size for order in orders), dtype=np.float64, count=len(orders))
+                total_size = float(sizes.sum())
                 
                 if abs(total_size - plan.total_size) < 0.001:
-                    latency = (time.time() - start_time) * 1000
+                    latency = _elapsed_ms(start_ns)
                     return True, f"TWAP algorithm created {len(orders)} orders (total: {total_size})", latency
                 else:
-                    return False, f"TWAP size mismatch: expected {plan.total_size}, got {total_size}", (time.time() - start_time) * 1000
+                    return False, f"TWAP size mismatch: expected {plan.total_size}, got {total_size}", _elapsed_ms(start_ns)
             else:
-                return False, "TWAP algorithm generated no orders", (time.time() - start_time) * 1000
+                return False, "TWAP algorithm generated no orders", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"TWAP algorithm test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"TWAP algorithm test failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_smart_order_routing(self) -> Tuple[bool, str, float]:
         """Test smart order routing"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test venue selection
-            best_venue = self.execution_engine.order_router.select_best_venue(
+            router = self.execution_engine.order_router
+            best_venue = router.select_best_venue(
                 symbol="BTCUSDT",
                 side="BUY",
                 size=0.5,
                 urgency="normal"
             )
             
+            # Test venue scoring (all venues in one call)
+            scores = router.score_all_venues("BTCUSDT", "BUY", 0.5, "normal")
+            
             # Validate venue selection
-            available_venues = list(self.execution_engine.order_router.exchange_configs.keys())
-            
-            if best_venue in available_venues:
-                # Test venue scoring
-                scores = {}
-                for venue in available_venues:
-                    config = self.execution_engine.order_router.exchange_configs[venue]
-                    score = self.execution_engine.order_router._calculate_venue_score(
-                        venue, config, "BTCUSDT", "BUY", 0.5, "normal"
-                    )
-                    scores[venue] = score
-                
+            if best_venue in scores:
                 # Best venue should have highest score
                 best_score = scores[best_venue]
-                if all(best_score >= score for score in scores.values()):
-                    latency = (time.time() - start_time) * 1000
+                if best_score >= max(scores.values()):
+                    latency = _elapsed_ms(start_ns)
                     return True, f"Smart routing selected {best_venue} (score: {best_score:.3f})", latency
                 else:
-                    return False, f"Suboptimal venue selected: {best_venue}", (time.time() - start_time) * 1000
+                    return False, f"Suboptimal venue selected: {best_venue}", _elapsed_ms(start_ns)
             else:
-                return False, f"Invalid venue selected: {best_venue}", (time.time() - start_time) * 1000
+                return False, f"Invalid venue selected: {best_venue}", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Smart order routing test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Smart order routing test failed: {str(e)}", _elapsed_ms(start_ns)
     
-    async def _test_risk_management(self):
+    async def _test_risk_management(self) -> List[Dict]:
         """Test risk management systems"""
         logger.info("🛡️ Testing Risk Management...")
         
-        # Test 18: Position Size Validation
-        await self._run_test(
-            "Position Size Validation",
-            self._test_position_size_validation
-        )
-        
-        # Test 19: Drawdown Protection
-        await self._run_test(
-            "Drawdown Protection",
-            self._test_drawdown_protection
-        )
+        return await self._run_tests([
+            # Test 18: Position Size Validation
+            ("Position Size Validation", self._test_position_size_validation),
+            # Test 19: Drawdown Protection
+            ("Drawdown Protection", self._test_drawdown_protection)
+        ])
     
     async def _test_position_size_validation(self) -> Tuple[bool, str, float]:
         """Test position size validation"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test various position sizes
@@ -872,148 +919,161 @@ class CommissioningTestSuite:
                 (-0.1, False),   # Invalid: negative size
             ]
             
-            validation_results = []
-            for size, expected_valid in test_cases:
-                # Simple validation logic
-                is_valid = isinstance(size, (int, float)) and size > 0
-                validation_results.append(is_valid == expected_valid)
+            sizes, expected = zip(*test_cases)
+            
+            # Simple validation logic, one vectorized pass over all cases
+            is_valid = np.array(sizes, dtype=np.float64) > 0
+            failed_count = int(np.count_nonzero(is_valid != np.array(expected, dtype=bool)))
             
-            if all(validation_results):
-                latency = (time.time() - start_time) * 1000
+            if failed_count == 0:
+                latency = _elapsed_ms(start_ns)
                 return True, f"Position size validation passed for {len(test_cases)} cases", latency
             else:
-                failed_count = sum(1 for r in validation_results if not r)
-                return False, f"{failed_count}/{len(test_cases)} validation tests failed", (time.time() - start_time) * 1000
+                return False, f"{failed_count}/{len(test_cases)} validation tests failed", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Position size validation failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Position size validation failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_drawdown_protection(self) -> Tuple[bool, str, float]:
         """Test drawdown protection"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Simulate portfolio with drawdown
-            original_portfolio = self.conductor.admission_controller.portfolio_state.copy()
-            
-            # Set high drawdown scenario
-            self.conductor.admission_controller.portfolio_state["daily_pnl"] = -35000  # -3.5% of 1M portfolio
+            ac = self.conductor.admission_controller
             
             # Create test intent
-            test_intent = Intent(
-                strategy="SMC_X",
-                symbol="BTCUSDT",
-                side=IntentAction.BUY,
-                size_hint=0.1,
-                confidence=0.80,
-                model_version="v2.1",
-                timestamp=datetime.utcnow().isoformat(),
-                reasoning="Test drawdown protection"
+            test_intent = dataclasses.replace(
+                self._intent_template, confidence=0.80, reasoning="Test drawdown protection"
             )
             
-            # Test admission control with high drawdown
-            result = await self.conductor.admission_controller.admit_intent(test_intent)
+            # Test admission control with high drawdown (-3.5% of 1M portfolio);
+            # the original value is restored on exit
+            with self._patch(ac.portfolio_state, daily_pnl=-35000):
+                result = await ac.admit_intent(test_intent)
             
             # Should be rejected due to drawdown
             if result.result.value == "REJECT" and "drawdown" in result.reason.lower():
-                # Restore original portfolio state
-                self.conductor.admission_controller.portfolio_state = original_portfolio
-                
-                latency = (time.time() - start_time) * 1000
+                latency = _elapsed_ms(start_ns)
                 return True, f"Drawdown protection working: {result.reason}", latency
             else:
-                # Restore original portfolio state
-                self.conductor.admission_controller.portfolio_state = original_portfolio
-                return False, f"Drawdown protection failed: {result.result.value} - {result.reason}", (time.time() - start_time) * 1000
+                return False, f"Drawdown protection failed: {result.result.value} - {result.reason}", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Drawdown protection test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Drawdown protection test failed: {str(e)}", _elapsed_ms(start_ns)
     
-    async def _test_performance(self):
+    @contextlib.contextmanager
+    def _patch(self, d: Dict, **overrides):
+        """Temporarily set keys of d, restoring only those keys on exit"""
+        missing = object()
+        saved = {key: d.get(key, missing) for key in overrides}
+        d.update(overrides)
+        try:
+            yield d
+        finally:
+            for key, value in saved.items():
+                if value is missing:
+                    d.pop(key, None)
+                else:
+                    d[key] = value
+    
+    async def _test_performance(self) -> List[Dict]:
         """Test performance metrics"""
         logger.info("🚀 Testing Performance...")
         
-        # Test 20: Latency Benchmarks
-        await self._run_test(
-            "Latency Benchmarks",
-            self._test_latency_benchmarks
-        )
-        
-        # Test 21: Throughput Testing
-        await self._run_test(
-            "Throughput Testing",
-            self._test_throughput
-        )
+        return await self._run_tests([
+            # Test 20: Latency Benchmarks
+            ("Latency Benchmarks", self._test_latency_benchmarks),
+            # Test 21: Throughput Testing
+            ("Throughput Testing", self._test_throughput)
+        ])
     
     async def _test_latency_benchmarks(self) -> Tuple[bool, str, float]:
         """Test latency benchmarks"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
-            # Test various operations and measure latency
-            latencies = {}
-            
-            # Test 1: Intent generation latency
-            intent_start = time.time()
+            # Test various operations and measure latency; the probes are
+            # independent, so they run concurrently and each times itself
             test_market_data = {"BTCUSDT": {"price": 45000, "volume": 1000000, "rsi": 50, "macd": 0, "volatility": 0.02, "sentiment": 0.5}}
-            await self.conductor.conduct_orchestra(test_market_data)
-            latencies["intent_generation"] = (time.time() - intent_start) * 1000
+            
+            # Test 1: Intent generation latency (own copy of the market data,
+            # since the conductor's state is shared with concurrent tests)
+            async def measure_intent_generation():
+                intent_start_ns = _ns()
+                await self.conductor.conduct_orchestra({symbol: dict(data) for symbol, data in test_market_data.items()})
+                return "intent_generation", _elapsed_ms(intent_start_ns)
             
             # Test 2: Order routing latency
-            routing_start = time.time()
-            self.execution_engine.order_router.select_best_venue("BTCUSDT", "BUY", 0.1)
-            latencies["order_routing"] = (time.time() - routing_start) * 1000
+            async def measure_order_routing():
+                routing_start_ns = _ns()
+                self.execution_engine.order_router.select_best_venue("BTCUSDT", "BUY", 0.1)
+                return "order_routing", _elapsed_ms(routing_start_ns)
             
             # Test 3: Risk check latency
-            risk_start = time.time()
-            test_intent = Intent(
-                strategy="test", symbol="BTCUSDT", side=IntentAction.BUY,
-                size_hint=0.1, confidence=0.8, model_version="v2.1",
-                timestamp=datetime.utcnow().isoformat(), reasoning="test"
-            )
-            self.conductor.admission_controller._check_portfolio_risk(test_intent)
-            latencies["risk_check"] = (time.time() - risk_start) * 1000
+            async def measure_risk_check():
+                risk_start_ns = _ns()
+                test_intent = dataclasses.replace(
+                    self._intent_template, strategy="test", confidence=0.8, reasoning="test"
+                )
+                self.conductor.admission_controller._check_portfolio_risk(test_intent)
+                return "risk_check", _elapsed_ms(risk_start_ns)
+            
+            latencies = dict(await asyncio.gather(
+                measure_intent_generation(),
+                measure_order_routing(),
+                measure_risk_check()
+            ))
             
             # Check if all latencies meet targets
             target_latency = self.test_config["performance_targets"]["api_latency"]
-            failed_checks = []
-            
-            for operation, latency in latencies.items():
-                if latency > target_latency:
-                    failed_checks.append(f"{operation}: {latency:.1f}ms")
+            failed_checks = [
+                f"{operation}: {latency:.1f}ms"
+                for operation, latency in latencies.items()
+                if latency > target_latency
+            ]
             
             if not failed_checks:
                 avg_latency = sum(latencies.values()) / len(latencies)
-                total_latency = (time.time() - start_time) * 1000
+                total_latency = _elapsed_ms(start_ns)
                 return True, f"All latency benchmarks passed (avg: {avg_latency:.1f}ms)", total_latency
             else:
-                return False, f"High latency operations: {', '.join(failed_checks)}", (time.time() - start_time) * 1000
+                return False, f"High latency operations: {', '.join(failed_checks)}", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Latency benchmark test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Latency benchmark test failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_throughput(self) -> Tuple[bool, str, float]:
         """Test system throughput"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test concurrent intent processing
             num_concurrent = 10
             test_market_data = {"BTCUSDT": {"price": 45000, "volume": 1000000, "rsi": 50, "macd": 0, "volatility": 0.02, "sentiment": 0.5}}
             
-            # Create concurrent tasks
-            tasks = []
-            for i in range(num_concurrent):
-                task = asyncio.create_task(self.conductor.conduct_orchestra(test_market_data))
-                tasks.append(task)
+            # Bound in-flight calls so the result reflects steady-state
+            # throughput rather than queueing behind the rate limiters
+            sem = asyncio.Semaphore(self.test_config.get("max_concurrency", 8))
+            
+            # Each call reports its own outcome, so one failure neither cancels
+            # its siblings nor escapes the task group
+            async def limited() -> bool:
+                async with sem:
+                    try:
+                        await self.conductor.conduct_orchestra(test_market_data)
+                        return True
+                    except Exception:
+                        return False
             
             # Execute all tasks concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(limited()) for _ in range(num_concurrent)]
             
             # Count successful executions
-            successful = sum(1 for r in results if not isinstance(r, Exception))
+            successful = sum(task.result() for task in tasks)
             
-            total_time = time.time() - start_time
+            total_time = (_ns() - start_ns) / 1e9
             throughput = successful / total_time  # operations per second
             
             if successful >= num_concurrent * 0.8:  # 80% success rate
@@ -1022,48 +1082,44 @@ class CommissioningTestSuite:
                 return False, f"Low throughput: {successful}/{num_concurrent} successful", total_time * 1000
                 
         except Exception as e:
-            return False, f"Throughput test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Throughput test failed: {str(e)}", _elapsed_ms(start_ns)
     
-    async def _test_failover_recovery(self):
+    async def _test_failover_recovery(self) -> List[Dict]:
         """Test failover and recovery mechanisms"""
         logger.info("🔄 Testing Failover & Recovery...")
         
-        # Test 22: Component Restart Recovery
-        await self._run_test(
-            "Component Restart Recovery",
-            self._test_component_restart
-        )
-        
-        # Test 23: Error Handling
-        await self._run_test(
-            "Error Handling",
-            self._test_error_handling
-        )
+        return await self._run_tests([
+            # Test 22: Component Restart Recovery
+            ("Component Restart Recovery", self._test_component_restart),
+            # Test 23: Error Handling
+            ("Error Handling", self._test_error_handling)
+        ])
     
     async def _test_component_restart(self) -> Tuple[bool, str, float]:
         """Test component restart recovery"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test conductor restart
             original_models = self.conductor.ai_models.copy()
             
-            # Simulate restart by reinitializing
-            self.conductor = AIOrchestralConductor()
+            # Simulate restart in place (reloads the model registry without
+            # rebuilding the policy engine and admission controller)
+            self.conductor.soft_restart()
             
             # Check if models are reloaded
             if len(self.conductor.ai_models) == len(original_models):
-                latency = (time.time() - start_time) * 1000
+                latency = _elapsed_ms(start_ns)
                 return True, f"Component restart successful ({len(self.conductor.ai_models)} models reloaded)", latency
             else:
-                return False, f"Model reload failed: {len(self.conductor.ai_models)}/{len(original_models)}", (time.time() - start_time) * 1000
+                return False, f"Model reload failed: {len(self.conductor.ai_models)}/{len(original_models)}", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Component restart test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Component restart test failed: {str(e)}", _elapsed_ms(start_ns)
     
     async def _test_error_handling(self) -> Tuple[bool, str, float]:
         """Test error handling"""
-        start_time = time.time()
+        start_ns = _ns()
         
         try:
             # Test handling of invalid market data
@@ -1074,36 +1130,51 @@ class CommissioningTestSuite:
                 }
             }
             
-            # Should handle gracefully without crashing
+            # Should handle gracefully without crashing; a hung call is bounded
+            # so it cannot stall the rest of the commissioning run
+            timeout = self.test_config["test_timeouts"]["api_call"]
             try:
-                await self.conductor.conduct_orchestra(invalid_market_data)
+                await asyncio.wait_for(self.conductor.conduct_orchestra(invalid_market_data), timeout)
                 error_handled = True
+            except asyncio.TimeoutError:
+                return False, f"Invalid market data handling timed out after {timeout}s", _elapsed_ms(start_ns)
             except Exception:
                 error_handled = False
             
             # Test handling of invalid intent
             try:
-                invalid_intent = Intent(
-                    strategy="", symbol="", side=IntentAction.BUY,
+                invalid_intent = dataclasses.replace(
+                    self._intent_template, strategy="", symbol="",
                     size_hint=-1, confidence=2.0, model_version="",
-                    timestamp="invalid_timestamp", reasoning=""
+                    timestamp="invalid_timestamp"
+                )
+                decision = await asyncio.wait_for(self.conductor.admission_controller.admit_intent(invalid_intent), timeout)
+                # Should be rejected by the schema check, before any policy lookup
+                error_handled = (
+                    error_handled and
+                    decision.result.value == "REJECT" and
+                    "schema" in decision.reason.lower()
                 )
-                await self.conductor.admission_controller.admit_intent(invalid_intent)
-                error_handled = error_handled and True
+            except asyncio.TimeoutError:
+                return False, f"Invalid intent handling timed out after {timeout}s", _elapsed_ms(start_ns)
             except Exception:
                 error_handled = False
             
             if error_handled:
-                latency = (time.time() - start_time) * 1000
+                latency = _elapsed_ms(start_ns)
                 return True, "Error handling working correctly", latency
             else:
-                return False, "Error handling failed - system crashed", (time.time() - start_time) * 1000
+                return False, "Error handling failed - system crashed", _elapsed_ms(start_ns)
                 
         except Exception as e:
-            return False, f"Error handling test failed: {str(e)}", (time.time() - start_time) * 1000
+            return False, f"Error handling test failed: {str(e)}", _elapsed_ms(start_ns)
+    
+    async def _run_tests(self, tests: List[Tuple[str, Any]]) -> List[Dict]:
+        """Run a category's tests sequentially and return their results"""
+        return [await self._run_test(test_name, test_function) for test_name, test_function in tests]
     
-    async def _run_test(self, test_name: str, test_function):
-        """Run a single test and record results"""
+    async def _run_test(self, test_name: str, test_function) -> Dict:
+        """Run a single test and return its result"""
         logger.info(f"  🧪 Running: {test_name}")
         
         try:
@@ -1114,17 +1185,12 @@ class CommissioningTestSuite:
                 "status": "PASSED" if success else "FAILED",
                 "message": message,
                 "latency_ms": round(latency, 2),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": time.time()  # formatted in _finalize_results
             }
             
-            self.test_results["test_details"].append(test_result)
-            self.test_results["total_tests"] += 1
-            
             if success:
-                self.test_results["passed_tests"] += 1
                 logger.info(f"    ✅ {test_name}: {message} ({latency:.1f}ms)")
             else:
-                self.test_results["failed_tests"] += 1
                 logger.error(f"    ❌ {test_name}: {message} ({latency:.1f}ms)")
                 
         except Exception as e:
@@ -1133,18 +1199,40 @@ class CommissioningTestSuite:
                 "status": "ERROR",
                 "message": f"Test execution error: {str(e)}",
                 "latency_ms": 0,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": time.time()  # formatted in _finalize_results
             }
             
-            self.test_results["test_details"].append(test_result)
-            self.test_results["total_tests"] += 1
-            self.test_results["failed_tests"] += 1
-            
             logger.error(f"    💥 {test_name}: Test execution error: {str(e)}")
+        
+        if self._details_log is not None:
+            self._write_detail(test_result)
+        
+        return test_result
+    
+    def _write_detail(self, test_result: Dict):
+        """Append one test result to the JSON lines details log"""
+        if ORJSON_AVAILABLE:
+            self._details_log.write(orjson.dumps(test_result) + b"\n")
+        else:
+            self._details_log.write(json.dumps(test_result).encode('utf-8') + b"\n")
+        # Flush per record so a crashed run keeps every finished test
+        self._details_log.flush()
+    
+    def _record_results(self, test_results: List[Dict]):
+        """Add test results to the suite totals"""
+        passed = sum(1 for test_result in test_results if test_result["status"] == "PASSED")
+        
+        results = self.test_results
+        results["test_details"].extend(test_results)
+        results["total_tests"] += len(test_results)
+        results["passed_tests"] += passed
+        results["failed_tests"] += len(test_results) - passed
     
     def _finalize_results(self):
         """Finalize test results"""
         self.test_results["end_time"] = datetime.utcnow().isoformat()
+        for test in self.test_results["test_details"]:
+            test["timestamp"] = datetime.utcfromtimestamp(test["timestamp"]).isoformat()
         self.test_results["success_rate"] = (
             self.test_results["passed_tests"] / self.test_results["total_tests"] * 100
             if self.test_results["total_tests"] > 0 else 0
@@ -1160,26 +1248,36 @@ class CommissioningTestSuite:
             self.test_results["overall_status"] = "NEEDS_IMPROVEMENT"
         
         # Save results
-        results_file = "/home/ubuntu/ULTIMATE_LYRA_ECOSYSTEM_FINAL_SEGMENTED/tests/commissioning_test_results.json"
-        with open(results_file, 'w') as f:
-            json.dump(self.test_results, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(RESULTS_FILE, 'wb', buffering=1 << 20) as f:
+                f.write(orjson.dumps(self.test_results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(RESULTS_FILE, 'w') as f:
+                json.dump(self.test_results, f, indent=2)
         
-        # Print summary
-        logger.info("=" * 60)
-        logger.info("🎯 COMMISSIONING TEST RESULTS")
-        logger.info("=" * 60)
-        logger.info(f"📊 Total Tests: {self.test_results['total_tests']}")
-        logger.info(f"✅ Passed: {self.test_results['passed_tests']}")
-        logger.info(f"❌ Failed: {self.test_results['failed_tests']}")
-        logger.info(f"🎯 Success Rate: {self.test_results['success_rate']:.1f}%")
-        logger.info(f"🏆 Overall Status: {self.test_results['overall_status']}")
-        logger.info("=" * 60)
+        # Print summary (one log record, so concurrent writers cannot interleave it)
+        results = self.test_results
+        summary = [
+            "=" * 60,
+            "🎯 COMMISSIONING TEST RESULTS",
+            "=" * 60,
+            f"📊 Total Tests: {results['total_tests']}",
+            f"✅ Passed: {results['passed_tests']}",
+            f"❌ Failed: {results['failed_tests']}",
+            f"🎯 Success Rate: {results['success_rate']:.1f}%",
+            f"🏆 Overall Status: {results['overall_status']}",
+            "=" * 60
+        ]
+        
+        if results["failed_tests"] > 0:
+            summary.append("❌ Failed Tests:")
+            summary.extend(
+                f"   - {test['test_name']}: {test['message']}"
+                for test in results["test_details"]
+                if test["status"] in {"FAILED", "ERROR"}
+            )
         
-        if self.test_results["failed_tests"] > 0:
-            logger.info("❌ Failed Tests:")
-            for test in self.test_results["test_details"]:
-                if test["status"] in ["FAILED", "ERROR"]:
-                    logger.info(f"   - {test['test_name']}: {test['message']}")
+        logger.info("\n".join(summary))
 
 # Example usage
 async def main():
@@ -1195,4 +1293,7 @@ async def main():
         print(f"Error: {results.get('error', 'Unknown error')}")
 
 if __name__ == "__main__":
+    # Lower per-callback scheduling overhead for the many short simulated waits
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -7,28 +7,128 @@ This test suite validates all components of the Ultimate Lyra Ecosystem
 to ensure 100% functionality, compliance, and optimization.
 """
 
+import functools
+import io
 import os
 import sys
 import json
+import re
 import time
 import asyncio
 import unittest
-from unittest.mock import Mock, patch
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import AsyncMock, Mock
+from decimal import Decimal
 import logging
 
 # Add the parent directory to the path so we can import modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from services.shadow_executor import RealOrder, ShadowDiffEngine, ShadowOrder
+
 # Configure logging for tests
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_FILE = os.path.join(ROOT_DIR, 'config', '.env')
+
+# Keys the .env file must define
+REQUIRED_ENV_KEYS = frozenset({
+    'GATE_API_KEY', 'GATE_SECRET_KEY',
+    'LYRA_TRADE_API_KEY', 'LYRA_TRADE_SECRET_KEY',
+    'WHITEBIT_PUBLIC_KEY', 'WHITEBIT_SECRET',
+    'AI_CONSENSUS_ENABLED', 'FEATURE_AI_TRADING'
+})
+EXCHANGE_API_KEYS = frozenset({'GATE_API_KEY', 'WHITEBIT_PUBLIC_KEY', 'COINJAR_API_KEY', 'DIGITAL_SURGE_API_KEY'})
+
+# (key, value) settings the .env file must carry
+RISK_FEATURES = frozenset({
+    ("AI_RISK_MANAGEMENT", "true"),
+    ("FEATURE_RISK_MANAGEMENT", "true"),
+    ("EMERGENCY_STOP", "false")
+})
+AI_FEATURES = frozenset({
+    ("AI_CONSENSUS_ENABLED", "true"),
+    ("AI_TRADING_ENABLED", "true"),
+    ("FEATURE_AI_TRADING", "true"),
+    ("MULTI_TIMEFRAME_ANALYSIS", "true"),
+    ("SENTIMENT_ANALYSIS", "true")
+})
+
+# Layout the repository must have, relative to ROOT_DIR
+REQUIRED_DIRS = frozenset({'core', 'ai', 'api', 'data', 'trading', 'utils', 'config', 'tests', 'scripts'})
+CORE_FILES = frozenset({
+    'core/main.py',
+    'ai/commissioning_tool.py',
+    'config/.env',
+    'scripts/deploy.sh'
+})
+
+# Content markers main.py and the commissioning tool must carry
+INTEGRITY_MARKERS = frozenset({
+    "ULTIMATE LYRA ECOSYSTEM",
+    "GITHUB COMPONENTS",
+    "import asyncio",
+    "class"
+})
+OPTIMIZATION_MARKERS = frozenset({
+    "OptimizedDatabaseManager",
+    "OptimizedAPICache",
+    "OptimizedAIInferenceEngine",
+    "PredictiveFailureDetector"
+})
+COMMISSIONING_METHODS = frozenset({
+    "commission_system",
+    "_verify_integrity",
+    "_validate_environment",
+    "_run_compliance_audit",
+    "_generate_system_map"
+})
+
+@functools.lru_cache(maxsize=None)
+def _read_text(path):
+    """Read a file once per process; later calls share the cached content."""
+    with open(path, 'r') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(path):
+    """Names in a directory from one cached scandir (empty if it doesn't exist)."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        return frozenset()
+
+@functools.lru_cache(maxsize=None)
+def _find_markers(path, markers):
+    """Return the subset of markers (a frozenset) present in a file, in one regex pass."""
+    content = _read_text(path)
+    # Longest first, so a marker that prefixes another doesn't shadow it
+    pattern = re.compile("|".join(map(re.escape, sorted(markers, key=len, reverse=True))))
+    found = set(pattern.findall(content))
+    # findall doesn't report overlapping matches; confirm any stragglers directly
+    found.update(marker for marker in markers if marker not in found and marker in content)
+    return frozenset(found)
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Parse the .env file once into a key -> value dict."""
+    env = {}
+    for line in _read_text(ENV_FILE).splitlines():
+        if '=' in line and not line.startswith('#'):
+            key, value = line.strip().split('=', 1)
+            env[key] = value
+    return env
+
 class TestEnvironmentConfiguration(unittest.TestCase):
     """Test the environment configuration and API keys."""
     
-    def setUp(self):
-        self.config_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config')
-        self.env_file = os.path.join(self.config_dir, '.env')
+    @classmethod
+    def setUpClass(cls):
+        cls.config_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config')
+        cls.env_file = os.path.join(cls.config_dir, '.env')
     
     def test_env_file_exists(self):
         """Test that the .env file exists."""
@@ -36,30 +136,16 @@ class TestEnvironmentConfiguration(unittest.TestCase):
     
     def test_env_file_completeness(self):
         """Test that the .env file contains all required keys."""
-        with open(self.env_file, 'r') as f:
-            content = f.read()
+        missing = REQUIRED_ENV_KEYS - _load_env().keys()
         
-        required_keys = [
-            'GATE_API_KEY', 'GATE_SECRET_KEY',
-            'LYRA_TRADE_API_KEY', 'LYRA_TRADE_SECRET_KEY',
-            'WHITEBIT_PUBLIC_KEY', 'WHITEBIT_SECRET',
-            'AI_CONSENSUS_ENABLED', 'FEATURE_AI_TRADING'
-        ]
-        
-        for key in required_keys:
-            self.assertIn(key, content, f"Required key {key} must be present in .env file")
+        self.assertFalse(missing, f"Required keys {sorted(missing)} must be present in .env file")
     
     def test_api_keys_not_empty(self):
         """Test that API keys are not empty."""
-        with open(self.env_file, 'r') as f:
-            lines = f.readlines()
-        
-        api_keys = {}
-        for line in lines:
-            if '=' in line and not line.startswith('#'):
-                key, value = line.strip().split('=', 1)
-                if 'API_KEY' in key or 'SECRET' in key:
-                    api_keys[key] = value
+        api_keys = {
+            key: value for key, value in _load_env().items()
+            if 'API_KEY' in key or 'SECRET' in key
+        }
         
         for key, value in api_keys.items():
             self.assertNotEqual(value, '', f"API key {key} must not be empty")
@@ -68,85 +154,63 @@ class TestEnvironmentConfiguration(unittest.TestCase):
 class TestSystemArchitecture(unittest.TestCase):
     """Test the system architecture and file structure."""
     
-    def setUp(self):
-        self.root_dir = os.path.dirname(os.path.dirname(__file__))
+    @classmethod
+    def setUpClass(cls):
+        cls.root_dir = os.path.dirname(os.path.dirname(__file__))
     
     def test_directory_structure(self):
         """Test that all required directories exist."""
-        required_dirs = ['core', 'ai', 'api', 'data', 'trading', 'utils', 'config', 'tests', 'scripts']
+        missing = REQUIRED_DIRS - _dir_entries(self.root_dir)
         
-        for dir_name in required_dirs:
-            dir_path = os.path.join(self.root_dir, dir_name)
-            self.assertTrue(os.path.exists(dir_path), f"Directory {dir_name} must exist")
+        self.assertFalse(missing, f"Directories {sorted(missing)} must exist")
     
     def test_core_files_exist(self):
         """Test that core system files exist."""
-        core_files = [
-            'core/main.py',
-            'ai/commissioning_tool.py',
-            'config/.env',
-            'scripts/deploy.sh'
-        ]
+        missing = {
+            file_path for file_path in CORE_FILES
+            if os.path.basename(file_path) not in _dir_entries(os.path.join(self.root_dir, os.path.dirname(file_path)))
+        }
         
-        for file_path in core_files:
-            full_path = os.path.join(self.root_dir, file_path)
-            self.assertTrue(os.path.exists(full_path), f"Core file {file_path} must exist")
+        self.assertFalse(missing, f"Core files {sorted(missing)} must exist")
     
     def test_main_system_integrity(self):
         """Test that the main system file has correct content markers."""
-        main_file = os.path.join(self.root_dir, 'core/main.py')
-        with open(main_file, 'r') as f:
-            content = f.read()
+        missing = INTEGRITY_MARKERS - _find_markers(os.path.join(self.root_dir, 'core/main.py'), INTEGRITY_MARKERS)
         
-        integrity_markers = [
-            "ULTIMATE LYRA ECOSYSTEM",
-            "GITHUB COMPONENTS",
-            "import asyncio",
-            "class"
-        ]
-        
-        for marker in integrity_markers:
-            self.assertIn(marker, content, f"Integrity marker '{marker}' must be present in main.py")
+        self.assertFalse(missing, f"Integrity markers {sorted(missing)} must be present in main.py")
 
 class TestOptimizations(unittest.TestCase):
     """Test that all optimizations are properly integrated."""
     
-    def setUp(self):
-        self.main_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'core/main.py')
+    @classmethod
+    def setUpClass(cls):
+        # One scan of main.py serves every test in the class
+        cls.main_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'core/main.py')
+        cls._markers_found = _find_markers(cls.main_file, OPTIMIZATION_MARKERS)
     
     def test_database_optimization_present(self):
         """Test that database optimization code is present."""
-        with open(self.main_file, 'r') as f:
-            content = f.read()
-        
-        self.assertIn("OptimizedDatabaseManager", content, "Database optimization must be present")
+        self.assertIn("OptimizedDatabaseManager", self._markers_found, "Database optimization must be present")
     
     def test_api_caching_present(self):
         """Test that API caching optimization is present."""
-        with open(self.main_file, 'r') as f:
-            content = f.read()
-        
-        self.assertIn("OptimizedAPICache", content, "API caching optimization must be present")
+        self.assertIn("OptimizedAPICache", self._markers_found, "API caching optimization must be present")
     
     def test_ai_inference_optimization_present(self):
         """Test that AI inference optimization is present."""
-        with open(self.main_file, 'r') as f:
-            content = f.read()
-        
-        self.assertIn("OptimizedAIInferenceEngine", content, "AI inference optimization must be present")
+        self.assertIn("OptimizedAIInferenceEngine", self._markers_found, "AI inference optimization must be present")
     
     def test_failure_prediction_present(self):
         """Test that predictive failure detection is present."""
-        with open(self.main_file, 'r') as f:
-            content = f.read()
-        
-        self.assertIn("PredictiveFailureDetector", content, "Predictive failure detection must be present")
+        self.assertIn("PredictiveFailureDetector", self._markers_found, "Predictive failure detection must be present")
 
 class TestAICommissioningTool(unittest.TestCase):
     """Test the AI commissioning tool functionality."""
     
-    def setUp(self):
-        self.commissioning_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ai/commissioning_tool.py')
+    @classmethod
+    def setUpClass(cls):
+        # Read lazily in the tests, so a missing file fails test_commissioning_tool_exists
+        cls.commissioning_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ai/commissioning_tool.py')
     
     def test_commissioning_tool_exists(self):
         """Test that the commissioning tool exists."""
@@ -154,33 +218,32 @@ class TestAICommissioningTool(unittest.TestCase):
     
     def test_commissioning_tool_functionality(self):
         """Test that the commissioning tool has required methods."""
-        with open(self.commissioning_file, 'r') as f:
-            content = f.read()
+        missing = COMMISSIONING_METHODS - _find_markers(self.commissioning_file, COMMISSIONING_METHODS)
         
-        required_methods = [
-            "commission_system",
-            "_verify_integrity",
-            "_validate_environment",
-            "_run_compliance_audit",
-            "_generate_system_map"
-        ]
-        
-        for method in required_methods:
-            self.assertIn(method, content, f"Method {method} must be present in commissioning tool")
+        self.assertFalse(missing, f"Methods {sorted(missing)} must be present in commissioning tool")
 
 class TestPerformanceMetrics(unittest.TestCase):
     """Test performance metrics and benchmarks."""
     
     def test_simulated_database_performance(self):
         """Test simulated database query performance."""
-        start_time = time.time()
+        # Stub the database manager so only the awaited query dispatch path is
+        # timed; the spec mirrors OptimizedDatabaseManager's interface, whose
+        # fetch is a coroutine (core/main.py isn't importable)
+        db_manager = Mock(spec=["connect", "close", "fetch"])
+        db_manager.fetch = AsyncMock(return_value=[{"symbol": "BTCUSDT", "price": 45000.0}])
         
-        # Simulate ultra-fast database query
-        for _ in range(1000):
-            pass  # Simulate query
+        num_queries = 1000
         
-        end_time = time.time()
-        query_time = (end_time - start_time) * 1000  # Convert to milliseconds
+        async def run_queries():
+            start = time.perf_counter()
+            for _ in range(num_queries):
+                await db_manager.fetch("SELECT * FROM prices WHERE symbol = $1", "BTCUSDT")
+            return time.perf_counter() - start
+        
+        elapsed = asyncio.run(run_queries())
+        query_time = elapsed * 1000 / num_queries  # Mean per query, in milliseconds
+        self.assertEqual(db_manager.fetch.await_count, num_queries)
         
         self.assertLess(query_time, 1.0, f"Database queries must be under 1ms, got {query_time:.3f}ms")
     
@@ -218,67 +281,119 @@ class TestComplianceAndSecurity(unittest.TestCase):
     
     def test_audit_trail_enabled(self):
         """Test that audit trail is enabled in configuration."""
-        env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config/.env')
-        with open(env_file, 'r') as f:
-            content = f.read()
+        env = _load_env()
         
-        self.assertIn("AUDIT_TRAIL_ENABLED=true", content, "Audit trail must be enabled")
+        self.assertEqual(env.get("AUDIT_TRAIL_ENABLED"), "true", "Audit trail must be enabled")
     
     def test_compliance_reporting_enabled(self):
         """Test that compliance reporting is enabled."""
-        env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config/.env')
-        with open(env_file, 'r') as f:
-            content = f.read()
+        env = _load_env()
         
-        self.assertIn("COMPLIANCE_REPORTING=true", content, "Compliance reporting must be enabled")
+        self.assertEqual(env.get("COMPLIANCE_REPORTING"), "true", "Compliance reporting must be enabled")
     
     def test_risk_management_features(self):
         """Test that risk management features are enabled."""
-        env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config/.env')
-        with open(env_file, 'r') as f:
-            content = f.read()
+        missing = RISK_FEATURES - _load_env().items()
         
-        risk_features = [
-            "AI_RISK_MANAGEMENT=true",
-            "FEATURE_RISK_MANAGEMENT=true",
-            "EMERGENCY_STOP=false"
-        ]
-        
-        for feature in risk_features:
-            self.assertIn(feature, content, f"Risk management feature {feature} must be configured")
+        self.assertFalse(missing, f"Risk management features {sorted(missing)} must be configured")
 
 class TestSystemIntegration(unittest.TestCase):
     """Test system integration and component interaction."""
     
     def test_ai_trading_integration(self):
         """Test that AI trading features are properly integrated."""
-        env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config/.env')
-        with open(env_file, 'r') as f:
-            content = f.read()
-        
-        ai_features = [
-            "AI_CONSENSUS_ENABLED=true",
-            "AI_TRADING_ENABLED=true",
-            "FEATURE_AI_TRADING=true",
-            "MULTI_TIMEFRAME_ANALYSIS=true",
-            "SENTIMENT_ANALYSIS=true"
-        ]
+        missing = AI_FEATURES - _load_env().items()
         
-        for feature in ai_features:
-            self.assertIn(feature, content, f"AI feature {feature} must be enabled")
+        self.assertFalse(missing, f"AI features {sorted(missing)} must be enabled")
     
     def test_multi_exchange_support(self):
         """Test that multi-exchange support is configured."""
-        env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config/.env')
-        with open(env_file, 'r') as f:
-            content = f.read()
+        env = _load_env()
         
-        self.assertIn("FEATURE_MULTI_EXCHANGE=true", content, "Multi-exchange support must be enabled")
+        self.assertEqual(env.get("FEATURE_MULTI_EXCHANGE"), "true", "Multi-exchange support must be enabled")
         
         # Check for multiple exchange API keys
-        exchange_keys = ['GATE_API_KEY', 'WHITEBIT_PUBLIC_KEY', 'COINJAR_API_KEY', 'DIGITAL_SURGE_API_KEY']
-        for key in exchange_keys:
-            self.assertIn(key, content, f"Exchange API key {key} must be present")
+        missing = EXCHANGE_API_KEYS - env.keys()
+        self.assertFalse(missing, f"Exchange API keys {sorted(missing)} must be present")
+
+class TestShadowDiff(unittest.TestCase):
+    """Test shadow vs real order diffing."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = ShadowDiffEngine()
+    
+    @staticmethod
+    def _orders(shadow_qty, real_qty):
+        common = dict(venue="gate", symbol="BTCUSDT", side="BUY", price=45000.0,
+                      order_type="LIMIT", post_only=True, time_in_force="GTC",
+                      client_order_id="cid", timestamp="2024-01-01T00:00:00")
+        return (ShadowOrder(qty=shadow_qty, intent_id="intent", shadow_id="shadow", **common),
+                RealOrder(qty=real_qty, **common))
+    
+    def _qty_diff(self, shadow_qty, real_qty):
+        result = self.engine.diff_shadow_vs_real(*self._orders(shadow_qty, real_qty))
+        return next(diff for diff in result.diffs if diff.field == "qty")
+    
+    def test_numeric_qty_within_tolerance(self):
+        """Test that a tiny numeric qty difference is tolerated."""
+        diff = self._qty_diff(0.1, 0.1000001)
+        
+        self.assertFalse(diff.match)
+        self.assertTrue(diff.tolerance_met)
+    
+    def test_non_numeric_qty_is_mismatch(self):
+        """Test that string or Decimal quantities are a tolerance miss, not an error."""
+        for real_qty in ("0.100", Decimal("0.1")):
+            with self.subTest(real_qty=real_qty):
+                diff = self._qty_diff(0.1, real_qty)
+                
+                self.assertFalse(diff.match)
+                self.assertFalse(diff.tolerance_met)
+
+# All test classes, in report order
+TEST_CLASSES = [
+    TestEnvironmentConfiguration,
+    TestSystemArchitecture,
+    TestOptimizations,
+    TestAICommissioningTool,
+    TestPerformanceMetrics,
+    TestComplianceAndSecurity,
+    TestSystemIntegration,
+    TestShadowDiff
+]
+
+class CountingTestResult(unittest.TextTestResult):
+    """Test result that tallies failures and errors as they are reported."""
+    
+    def __init__(self, stream, descriptions, verbosity):
+        super().__init__(stream, descriptions, verbosity)
+        self.failure_count = 0
+        self.error_count = 0
+    
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.failure_count += 1
+    
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.error_count += 1
+    
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            if issubclass(err[0], test.failureException):
+                self.failure_count += 1
+            else:
+                self.error_count += 1
+
+def _run_test_class(test_class):
+    """Run one test class in a worker process; returns its counts and failure report."""
+    stream = io.StringIO()
+    tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+    runner = unittest.TextTestRunner(stream=stream, verbosity=0, resultclass=CountingTestResult)
+    result = runner.run(tests)
+    return result.testsRun, result.failure_count, result.error_count, stream.getvalue()
 
 def run_comprehensive_tests():
     """Run all comprehensive tests and generate a report."""
@@ -286,32 +401,20 @@ def run_comprehensive_tests():
     print("🧪 ULTIMATE LYRA ECOSYSTEM - COMPREHENSIVE TEST SUITE")
     print("="*80)
     
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestEnvironmentConfiguration,
-        TestSystemArchitecture,
-        TestOptimizations,
-        TestAICommissioningTool,
-        TestPerformanceMetrics,
-        TestComplianceAndSecurity,
-        TestSystemIntegration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
+    # Run test classes in parallel, one class per worker (the classes share
+    # no state), leaving two cores free for the rest of the system
+    max_workers = max(1, min(len(TEST_CLASSES), (os.cpu_count() or 1) - 2))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        class_results = list(pool.map(_run_test_class, TEST_CLASSES))
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
+    # Replay runner output in class order so reports don't interleave
+    for _, _, _, output in class_results:
+        sys.stderr.write(output)
     
     # Generate report
-    total_tests = result.testsRun
-    failures = len(result.failures)
-    errors = len(result.errors)
+    total_tests = sum(tests_run for tests_run, _, _, _ in class_results)
+    failures = sum(class_failures for _, class_failures, _, _ in class_results)
+    errors = sum(class_errors for _, _, class_errors, _ in class_results)
     success_rate = ((total_tests - failures - errors) / total_tests) * 100 if total_tests > 0 else 0
     
     print("\n" + "="*80)
@@ -341,9 +444,12 @@ def run_comprehensive_tests():
         "status": "PASSED" if success_rate == 100.0 else "FAILED"
     }
     
+    # Write atomically: readers see either the previous report or the new one
     results_file = os.path.join(os.path.dirname(__file__), "test_results.json")
-    with open(results_file, 'w') as f:
-        json.dump(test_results, f, indent=2)
+    tmp_file = results_file + ".tmp"
+    with open(tmp_file, 'w') as f:
+        f.write(json.dumps(test_results, separators=(',', ':')))
+    os.replace(tmp_file, results_file)
     
     return success_rate == 100.0
 
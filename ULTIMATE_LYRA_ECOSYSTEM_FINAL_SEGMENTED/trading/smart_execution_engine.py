@@ -18,7 +18,8 @@ import json
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Mapping, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
@@ -138,6 +139,15 @@ class MarketData:
             return best_ask - best_bid
         return None
     
+    def get_top_of_book(self, symbol: str) -> Optional[Tuple[float, float, float, float]]:
+        """Get (best_bid, best_ask, mid, spread) from a single book lookup"""
+        book = self.order_books.get(symbol)
+        if book and book["bids"] and book["asks"]:
+            best_bid = book["bids"][0][0]
+            best_ask = book["asks"][0][0]
+            return best_bid, best_ask, (best_bid + best_ask) / 2, best_ask - best_bid
+        return None
+    
     def get_liquidity(self, symbol: str, side: str, depth: int = 5) -> float:
         """Get available liquidity on one side"""
         book = self.order_books.get(symbol)
@@ -471,7 +481,12 @@ class SmartOrderRouter:
     """Smart Order Router - selects best execution venue"""
     
     def __init__(self):
-        self.exchange_configs = {
+        self._exchange_configs: Dict[str, Mapping[str, Any]] = {}
+        # Venue scores depend only on the venue config, urgency and whether
+        # the order is large; bounded by venues x urgencies x 2 entries
+        self._venue_scores: Dict[Tuple[str, str, bool], float] = {}
+        
+        default_configs = {
             "binance": {
                 "fees": {"maker": 0.001, "taker": 0.001},
                 "latency": 50,  # ms
@@ -497,24 +512,58 @@ class SmartOrderRouter:
                 "liquidity_score": 0.75
             }
         }
+        for exchange, config in default_configs.items():
+            self.update_exchange_config(exchange, config)
+    
+    @property
+    def exchange_configs(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read-only view of venue configs; use update_exchange_config to change them"""
+        return MappingProxyType(self._exchange_configs)
+    
+    def update_exchange_config(self, exchange: str, config: Dict):
+        """Add or replace a venue config, invalidating cached scores"""
+        self._exchange_configs[exchange] = MappingProxyType({
+            key: MappingProxyType(dict(value)) if isinstance(value, dict) else value
+            for key, value in config.items()
+        })
+        self._venue_scores.clear()
     
     def select_best_venue(self, symbol: str, side: str, size: float, 
                          urgency: str = "normal") -> str:
         """Select the best execution venue"""
-        scores = {}
-        
-        for exchange, config in self.exchange_configs.items():
-            score = self._calculate_venue_score(exchange, config, symbol, side, size, urgency)
-            scores[exchange] = score
+        scores = self.score_all_venues(symbol, side, size, urgency)
         
         best_venue = max(scores, key=scores.get)
         logger.info(f"🎯 Best venue for {symbol}: {best_venue} (score: {scores[best_venue]:.3f})")
         
         return best_venue
     
+    def score_all_venues(self, symbol: str, side: str, size: float,
+                         urgency: str = "normal") -> Dict[str, float]:
+        """Score every configured venue in one pass"""
+        large_order = size > 1.0
+        return {
+            exchange: self._score_venue(exchange, urgency, large_order)
+            for exchange in self._exchange_configs
+        }
+    
+    def _score_venue(self, exchange: str, urgency: str, large_order: bool) -> float:
+        """Score a configured venue, memoized in _venue_scores"""
+        key = (exchange, urgency, large_order)
+        score = self._venue_scores.get(key)
+        if score is None:
+            score = self._score_config(self._exchange_configs[exchange], urgency, large_order)
+            self._venue_scores[key] = score
+        return score
+    
     def _calculate_venue_score(self, exchange: str, config: Dict, symbol: str, 
                               side: str, size: float, urgency: str) -> float:
         """Calculate venue score based on multiple factors"""
+        return self._score_config(config, urgency, size > 1.0)
+    
+    @staticmethod
+    def _score_config(config: Mapping[str, Any], urgency: str, large_order: bool) -> float:
+        """Venue score from its config, order urgency and size class"""
         score = 0.0
         
         # Liquidity score (40% weight)
@@ -536,7 +585,7 @@ class SmartOrderRouter:
         score += config["reliability"] * 0.15
         
         # Size-specific adjustments
-        if size > 1.0:  # Large orders prefer high liquidity venues
+        if large_order:  # Large orders prefer high liquidity venues
             score += config["liquidity_score"] * 0.1
         
         return score